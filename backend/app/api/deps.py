@@ -8,21 +8,27 @@ Provides dependency injection for FastAPI routes including:
 - Request context extraction
 """
 
+from functools import lru_cache
 from typing import Optional, Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models.user import User, UserRole
-from app.core.jwt import decode_token, verify_token_type
+from app.models.user import User, UserRole, ROLE_LEVEL
+from app.core.jwt import decode_access_token
+from app.core.user_cache import user_cache
 
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Token -> user lookup, built once so every request reuses the cached compiled SQL
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
 
-async def get_current_user(
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -42,8 +48,7 @@ async def get_current_user(
     token = credentials.credentials
     
     # Decode and validate token
-    payload = decode_token(token)
-    verify_token_type(payload, "access")
+    payload = decode_access_token(token)
     
     # Extract user info from token
     user_id = payload.get("user_id")
@@ -54,14 +59,17 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from cache, falling back to the database
+    user = user_cache.get(user_id, db)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        user = db.execute(_USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user_cache.set(user)
     
     # Check if user is active
     if not user.is_active:
@@ -73,17 +81,7 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """
-    Get current active user (alias for get_current_user).
-    
-    This is kept for clarity and consistency with FastAPI patterns.
-    """
-    return current_user
-
-
+@lru_cache(maxsize=None)
 def require_role(required_role: UserRole):
     """
     Decorator factory for role-based access control.
@@ -99,10 +97,13 @@ def require_role(required_role: UserRole):
         required_role: Minimum required role
         
     Returns:
-        Dependency function that checks role
+        Dependency function that checks role (one shared instance per role,
+        so FastAPI resolves it once per request)
     """
+    required_level = ROLE_LEVEL[required_role]
+    
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if not current_user.has_permission(required_role):
+        if ROLE_LEVEL.get(current_user.role, 0) < required_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. {required_role.value} role required.",
@@ -118,7 +119,7 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     
     Convenience function for admin-only endpoints.
     """
-    if current_user.role != UserRole.ADMIN:
+    if ROLE_LEVEL.get(current_user.role, 0) < ROLE_LEVEL[UserRole.ADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
@@ -126,13 +127,17 @@ def require_admin(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+# Shared dependency markers, so routes reuse one Depends object per check
+ADMIN_DEP = Depends(require_admin)
+
+
 def require_manager_or_admin(current_user: User = Depends(get_current_user)) -> User:
     """
     Require manager or admin role dependency.
     
     Convenience function for manager/admin endpoints.
     """
-    if current_user.role not in [UserRole.MANAGER, UserRole.ADMIN]:
+    if ROLE_LEVEL.get(current_user.role, 0) < ROLE_LEVEL[UserRole.MANAGER]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Manager or admin privileges required",
@@ -158,7 +163,8 @@ def get_client_ip(request) -> Optional[str]:
     """
     Extract client IP address from request.
     
-    Checks X-Forwarded-For header for proxied requests.
+    Checks X-Forwarded-For header for proxied requests. The result is
+    memoized on request.state, so repeated calls within a request are free.
     
     Args:
         request: FastAPI Request object
@@ -166,19 +172,28 @@ def get_client_ip(request) -> Optional[str]:
     Returns:
         str: Client IP address
     """
+    state = request.state
+    try:
+        return state.client_ip
+    except AttributeError:
+        pass
+    
     # Check if behind proxy
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
         # Get first IP in chain
-        return forwarded_for.split(",")[0].strip()
+        client_ip = forwarded_for.partition(",")[0].strip()
+    else:
+        # Direct connection
+        client_ip = request.client.host if request.client else None
     
-    # Direct connection
-    return request.client.host if request.client else None
+    state.client_ip = client_ip
+    return client_ip
 
 
 def get_user_agent(request) -> Optional[str]:
     """
-    Extract user agent from request.
+    Extract user agent from request (memoized on request.state).
     
     Args:
         request: FastAPI Request object
@@ -186,4 +201,9 @@ def get_user_agent(request) -> Optional[str]:
     Returns:
         str: User agent string
     """
-    return request.headers.get("User-Agent")
+    state = request.state
+    try:
+        return state.user_agent
+    except AttributeError:
+        state.user_agent = request.headers.get("User-Agent")
+        return state.user_agent
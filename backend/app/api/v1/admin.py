@@ -5,15 +5,18 @@ Administrative endpoints for user management and system statistics.
 Accessible only to users with Admin role.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, insert, func, and_, or_, bindparam
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
 
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.data_classification import DataItem, SensitivityLevel
-from app.models.audit_log import AuditLog
+from app.models.audit_log import AuditLog, HIGH_RISK_SCORE
 from app.schemas.admin import (
     UserCreateRequest,
     UserUpdateRequest,
@@ -22,17 +25,24 @@ from app.schemas.admin import (
     SystemStatsResponse
 )
 from app.core.security import hash_password
+from app.core.user_cache import user_cache
+from app.core.response_cache import response_cache
 from app.api.deps import get_current_user, require_role
 from app.utils.logger import logger
+from app.config import settings
 
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Columns selected for the user listing, in response schema order
+_USER_LIST_COLUMNS = tuple(getattr(User, field) for field in UserListResponse.model_fields)
+
 
 @router.get("/users", response_model=List[UserListResponse])
-async def list_users(
-    skip: int = 0,
-    limit: int = 100,
+def list_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0, description="Return users after this ID (keyset cursor)"),
     current_user: User = Depends(require_role(UserRole.ADMIN)),
     db: Session = Depends(get_db)
 ):
@@ -40,14 +50,21 @@ async def list_users(
     List all users in the system (Admin only).
     
     Returns user details including role, status, and login information.
+    Pass the last returned user ID as `after_id` to fetch the next page
+    without an OFFSET scan.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    logger.info(f"Admin {current_user.username} listed {len(users)} users")
-    return users
+    query = select(*_USER_LIST_COLUMNS).order_by(User.id)
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+    rows = db.execute(query.offset(skip).limit(limit)).all()
+    logger.info(f"Admin {current_user.username} listed {len(rows)} users")
+    
+    # Rows already match UserListResponse - serialize them directly
+    return ORJSONResponse([row._asdict() for row in rows])
 
 
 @router.post("/users", response_model=UserListResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     user_data: UserCreateRequest,
     current_user: User = Depends(require_role(UserRole.ADMIN)),
     db: Session = Depends(get_db)
@@ -57,41 +74,45 @@ async def create_user(
     
     Creates a new user with specified role and credentials.
     """
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already exists"
-        )
-    
-    # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
-    if existing_email:
+    # Create new user; RETURNING gives back the generated row in the same round trip
+    try:
+        new_user = db.execute(
+            insert(User)
+            .values(
+                username=user_data.username,
+                email=user_data.email,
+                password_hash=hash_password(user_data.password),
+                role=user_data.role,
+                is_active=user_data.is_active
+            )
+            .returning(User)
+        ).scalar_one()
+    except IntegrityError:
+        # The unique constraints are the authoritative (race-free) check;
+        # only on conflict look up which field collided for the message
+        db.rollback()
+        existing = db.execute(
+            select(User.username).where(
+                or_(User.username == user_data.username, User.email == user_data.email)
+            )
+        ).first()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already exists"
+            detail="Username already exists" if existing and existing.username == user_data.username
+            else "Email already exists"
         )
     
-    # Create new user
-    new_user = User(
-        username=user_data.username,
-        email=user_data.email,
-        password_hash=hash_password(user_data.password),
-        role=user_data.role,
-        is_active=user_data.is_active
-    )
-    
-    db.add(new_user)
+    # Serialize before commit so the expired instance is not reloaded
+    response = UserListResponse.model_validate(new_user)
     db.commit()
-    db.refresh(new_user)
+    response_cache.invalidate("/admin/stats")
     
-    logger.info(f"Admin {current_user.username} created new user: {new_user.username} (role: {new_user.role.value})")
-    return new_user
+    logger.info(f"Admin {current_user.username} created new user: {response.username} (role: {response.role})")
+    return response
 
 
 @router.put("/users/{user_id}", response_model=UserListResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdateRequest,
     current_user: User = Depends(require_role(UserRole.ADMIN)),
@@ -102,7 +123,7 @@ async def update_user(
     
     Updates user details such as email, role, active status, etc.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -114,9 +135,11 @@ async def update_user(
     
     if "email" in update_data:
         # Check email uniqueness
-        existing = db.query(User).filter(
-            User.email == update_data["email"],
-            User.id != user_id
+        existing = db.execute(
+            select(User.id).where(
+                User.email == update_data["email"],
+                User.id != user_id
+            )
         ).first()
         if existing:
             raise HTTPException(
@@ -138,6 +161,8 @@ async def update_user(
         user.mfa_enabled = update_data["mfa_enabled"]
     
     db.commit()
+    user_cache.invalidate(user.id)
+    response_cache.invalidate("/admin/stats")
     db.refresh(user)
     
     logger.info(f"Admin {current_user.username} updated user: {user.username}")
@@ -145,7 +170,7 @@ async def update_user(
 
 
 @router.put("/users/{user_id}/role", response_model=UserListResponse)
-async def update_user_role(
+def update_user_role(
     user_id: int,
     role_data: RoleUpdateRequest,
     current_user: User = Depends(require_role(UserRole.ADMIN)),
@@ -156,7 +181,7 @@ async def update_user_role(
     
     Changes the role of a specified user.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -173,6 +198,8 @@ async def update_user_role(
     old_role = user.role.value
     user.role = role_data.role
     db.commit()
+    user_cache.invalidate(user.id)
+    response_cache.invalidate("/admin/stats")
     db.refresh(user)
     
     logger.info(f"Admin {current_user.username} changed role of {user.username}: {old_role} -> {role_data.role.value}")
@@ -180,7 +207,7 @@ async def update_user_role(
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: User = Depends(require_role(UserRole.ADMIN)),
     db: Session = Depends(get_db)
@@ -190,7 +217,7 @@ async def delete_user(
     
     Permanently removes a user from the system.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -207,61 +234,56 @@ async def delete_user(
     username = user.username
     db.delete(user)
     db.commit()
+    user_cache.invalidate(user_id)
+    response_cache.invalidate("/admin/stats")
     
     logger.info(f"Admin {current_user.username} deleted user: {username}")
     return None
 
 
-@router.get("/stats", response_model=SystemStatsResponse)
-async def get_system_stats(
-    current_user: User = Depends(require_role(UserRole.ADMIN)),
-    db: Session = Depends(get_db)
-):
-    """
-    Get system-wide statistics (Admin only).
-    
-    Returns comprehensive statistics about users, data, and system activity.
-    """
-    # User statistics
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    
-    users_by_role = {}
-    for role in UserRole:
-        count = db.query(User).filter(User.role == role).count()
-        users_by_role[role.value] = count
-    
-    # Data statistics
-    total_data_items = db.query(DataItem).count()
-    
-    data_by_sensitivity = {}
-    for level in SensitivityLevel:
-        count = db.query(DataItem).filter(DataItem.sensitivity_level == level.value).count()
-        data_by_sensitivity[level.value] = count
-    
-    # Activity statistics
-    total_operations = db.query(AuditLog).count()
-    
-    # Recent activity (last 24 hours)
+# Stats queries and their result keys, built once at import
+_ROLE_KEYS = tuple(role.value for role in UserRole)
+_SENSITIVITY_KEYS = tuple(level.value for level in SensitivityLevel)
+
+_USER_STATS_QUERY = select(
+    func.count(),
+    func.count().filter(User.is_active == True),
+    *(func.count().filter(User.role == role) for role in UserRole),
+).select_from(User)
+
+_DATA_STATS_QUERY = select(
+    func.count(),
+    *(func.count().filter(DataItem.sensitivity_level == level) for level in SensitivityLevel),
+).select_from(DataItem)
+
+_since = bindparam("since")
+_ACTIVITY_STATS_QUERY = select(
+    func.count(),
+    func.count().filter(AuditLog.timestamp >= _since),
+    func.count().filter(and_(AuditLog.action == "login_failed", AuditLog.timestamp >= _since)),
+    func.count().filter(and_(AuditLog.risk_score >= HIGH_RISK_SCORE, AuditLog.timestamp >= _since)),
+).select_from(AuditLog)
+
+
+def _compute_system_stats(db: Session) -> SystemStatsResponse:
+    """Aggregate user, data and activity counts for the stats endpoint."""
     yesterday = datetime.utcnow() - timedelta(days=1)
-    recent_activity = db.query(AuditLog).filter(
-        AuditLog.timestamp >= yesterday
-    ).count()
     
-    # Security statistics
-    total_audit_logs = total_operations
+    # User statistics (one conditional count per role, zero-filled)
+    total_users, active_users, *role_counts = db.execute(_USER_STATS_QUERY).one()
+    users_by_role = dict(zip(_ROLE_KEYS, role_counts))
     
-    failed_logins_24h = db.query(AuditLog).filter(
-        AuditLog.action == "login_failed",
-        AuditLog.timestamp >= yesterday
-    ).count()
+    # Data statistics (one conditional count per sensitivity level, zero-filled)
+    total_data_items, *level_counts = db.execute(_DATA_STATS_QUERY).one()
+    data_by_sensitivity = dict(zip(_SENSITIVITY_KEYS, level_counts))
     
-    high_risk_actions_24h = db.query(AuditLog).filter(
-        AuditLog.risk_score >= 61,
-        AuditLog.timestamp >= yesterday
-    ).count()
+    # Activity and security statistics (recent = last 24 hours)
+    total_operations, recent_activity, failed_logins_24h, high_risk_actions_24h = db.execute(
+        _ACTIVITY_STATS_QUERY, {"since": yesterday}
+    ).one()
+    total_audit_logs = total_operations
     
-    stats = SystemStatsResponse(
+    return SystemStatsResponse(
         total_users=total_users,
         active_users=active_users,
         users_by_role=users_by_role,
@@ -273,6 +295,23 @@ async def get_system_stats(
         failed_logins_24h=failed_logins_24h,
         high_risk_actions_24h=high_risk_actions_24h
     )
+
+
+@router.get("/stats", response_model=SystemStatsResponse)
+def get_system_stats(
+    current_user: User = Depends(require_role(UserRole.ADMIN)),
+    db: Session = Depends(get_db)
+):
+    """
+    Get system-wide statistics (Admin only).
+    
+    Returns comprehensive statistics about users, data, and system activity.
+    """
+    stats = response_cache.get_or_set(
+        ("/admin/stats",),
+        ttl_seconds=30,
+        compute=lambda: _compute_system_stats(db)
+    )
     
     logger.info(f"Admin {current_user.username} retrieved system statistics")
     return stats
@@ -4,27 +4,46 @@ Analytics API Endpoints
 Provides audit logs, statistics, and security analytics.
 """
 
-from typing import Optional
+from typing import Any, Iterable, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.models.audit_log import HIGH_RISK_SCORE
 from app.models.user import User
 from app.schemas.audit import AuditLogResponse, AuditStatsResponse, SecurityAlertResponse
-from app.api.deps import get_current_user, require_admin
+from app.api.deps import get_current_user, ADMIN_DEP
 from app.services.audit_service import AuditService
+from app.core.response_cache import response_cache
 from app.utils.logger import logger
 
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+# Prebuilt list schemas: validate rows and encode JSON in a single pass
+_AUDIT_LOG_LIST = TypeAdapter(List[AuditLogResponse])
+_ALERT_LIST = TypeAdapter(List[SecurityAlertResponse])
+
+
+def _dump_list(adapter: TypeAdapter, items: Iterable[Any]) -> bytes:
+    """Validate ORM rows/dicts against a list schema and encode them as JSON."""
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+
+def _json_response(content: bytes) -> Response:
+    """Wrap already-encoded JSON without another validation/serialization pass."""
+    return Response(content=content, media_type="application/json")
+
 
 @router.get("/audit", response_model=list[AuditLogResponse])
-async def get_audit_logs(
+def get_audit_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=500),
     action: Optional[str] = None,
     success_only: Optional[bool] = None,
+    before_id: Optional[int] = Query(None, ge=1, description="Return logs older than this ID (keyset cursor)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -41,36 +60,39 @@ async def get_audit_logs(
         logs = audit_service.get_user_logs(
             user_id=current_user.id,
             limit=limit,
-            offset=skip
+            offset=skip,
+            before_id=before_id
         )
     else:
         # Admins can see all logs
         logs = audit_service.get_recent_logs(
             limit=limit,
             action=action,
-            success_only=success_only
+            success_only=success_only,
+            before_id=before_id
         )
     
-    return logs
+    return _json_response(_dump_list(_AUDIT_LOG_LIST, logs))
 
 
 @router.get("/audit/user/{user_id}", response_model=list[AuditLogResponse])
-async def get_user_audit_logs(
+def get_user_audit_logs(
     user_id: int,
     limit: int = Query(50, ge=1, le=500),
-    current_user: User = Depends(require_admin),
+    before_id: Optional[int] = Query(None, ge=1, description="Return logs older than this ID (keyset cursor)"),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
     Get audit logs for a specific user (admin only).
     """
     audit_service = AuditService(db)
-    logs = audit_service.get_user_logs(user_id=user_id, limit=limit)
-    return logs
+    logs = audit_service.get_user_logs(user_id=user_id, limit=limit, before_id=before_id)
+    return _json_response(_dump_list(_AUDIT_LOG_LIST, logs))
 
 
 @router.get("/stats", response_model=AuditStatsResponse)
-async def get_statistics(
+def get_statistics(
     days: int = Query(7, ge=1, le=90),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -80,16 +102,17 @@ async def get_statistics(
     
     - Available to all users (shows system-wide stats)
     """
-    audit_service = AuditService(db)
-    stats = audit_service.get_statistics(days=days)
-    
-    return AuditStatsResponse(**stats)
+    return _json_response(response_cache.get_or_set(
+        ("/analytics/stats", days),
+        ttl_seconds=60,
+        compute=lambda: AuditStatsResponse(**AuditService(db).get_statistics(days=days)).model_dump_json().encode()
+    ))
 
 
 @router.get("/alerts", response_model=list[SecurityAlertResponse])
-async def get_security_alerts(
+def get_security_alerts(
     limit: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(require_admin),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
@@ -97,17 +120,19 @@ async def get_security_alerts(
     
     - Shows failed logins, high-risk actions, etc.
     """
-    audit_service = AuditService(db)
-    alerts = audit_service.get_security_alerts(limit=limit)
-    
-    return [SecurityAlertResponse(**alert) for alert in alerts]
+    return _json_response(response_cache.get_or_set(
+        ("/analytics/alerts", limit),
+        ttl_seconds=15,
+        compute=lambda: _dump_list(_ALERT_LIST, AuditService(db).get_security_alerts(limit=limit))
+    ))
 
 
 @router.get("/high-risk", response_model=list[AuditLogResponse])
-async def get_high_risk_actions(
-    threshold: int = Query(61, ge=0, le=100),
+def get_high_risk_actions(
+    threshold: int = Query(HIGH_RISK_SCORE, ge=0, le=100),
     limit: int = Query(50, ge=1, le=200),
-    current_user: User = Depends(require_admin),
+    before_id: Optional[int] = Query(None, ge=1, description="Return logs older than this ID (keyset cursor)"),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
@@ -115,6 +140,13 @@ async def get_high_risk_actions(
     
     - Shows actions above a risk threshold
     """
-    audit_service = AuditService(db)
-    logs = audit_service.get_high_risk_logs(threshold=threshold, limit=limit)
-    return logs
+    return _json_response(response_cache.get_or_set(
+        ("/analytics/high-risk", threshold, limit, before_id),
+        ttl_seconds=15,
+        compute=lambda: _dump_list(
+            _AUDIT_LOG_LIST,
+            AuditService(db).get_high_risk_logs(
+                threshold=threshold, limit=limit, before_id=before_id
+            )
+        )
+    ))
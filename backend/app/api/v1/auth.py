@@ -6,8 +6,11 @@ Handles user registration, login, token refresh, and user management.
 
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, insert, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from app.database import get_db
 from app.models.user import User, UserRole
@@ -21,6 +24,8 @@ from app.schemas.user import (
 from app.core.security import (
     hash_password,
     verify_password,
+    password_needs_rehash,
+    dummy_password_hash,
     calculate_risk_score,
     requires_mfa,
 )
@@ -30,13 +35,15 @@ from app.core.jwt import (
     decode_token,
     verify_token_type,
 )
+from app.core.user_cache import user_cache
+from app.core.response_cache import response_cache
 from app.api.deps import (
     get_current_user,
     get_client_ip,
     get_user_agent,
-    require_admin,
+    ADMIN_DEP,
 )
-from app.services.audit_service import AuditService
+from app.services.audit_queue import audit_queue
 from app.utils.logger import logger
 from app.config import settings
 from slowapi import Limiter
@@ -46,9 +53,13 @@ from slowapi.util import get_remote_address
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 limiter = Limiter(key_func=get_remote_address)
 
+# Fields exposed by UserResponse (read straight off User rows / columns)
+_USER_RESPONSE_FIELDS = tuple(UserResponse.model_fields)
+_USER_RESPONSE_COLUMNS = tuple(getattr(User, field) for field in _USER_RESPONSE_FIELDS)
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     request: Request = None
@@ -60,41 +71,44 @@ async def register(
     - Logs the registration event
     - Returns user details (without password)
     """
-    # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
+    # Hash password
+    hashed_password = hash_password(user_data.password)
     
-    # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
-    if existing_email:
+    # Create user; RETURNING gives back the generated row in the same round trip
+    try:
+        new_user = db.execute(
+            insert(User)
+            .values(
+                username=user_data.username,
+                email=user_data.email,
+                password_hash=hashed_password,
+                role=user_data.role or UserRole.USER,
+            )
+            .returning(User)
+        ).scalar_one()
+    except IntegrityError:
+        # The unique constraints are the authoritative (race-free) check;
+        # only on conflict look up which field collided for the message
+        db.rollback()
+        existing = db.execute(
+            select(User.username).where(
+                or_(User.username == user_data.username, User.email == user_data.email)
+            )
+        ).first()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+            detail="Username already registered" if existing and existing.username == user_data.username
+            else "Email already registered"
         )
     
-    # Hash password
-    hashed_password = hash_password(user_data.password)
-    
-    # Create user
-    new_user = User(
-        username=user_data.username,
-        email=user_data.email,
-        password_hash=hashed_password,
-        role=user_data.role or UserRole.USER,
-    )
-    
-    db.add(new_user)
+    # Serialize before commit so the expired instance is not reloaded
+    response = UserResponse.model_validate(new_user)
     db.commit()
-    db.refresh(new_user)
+    response_cache.invalidate("/admin/stats")
     
-    # Log registration
-    audit_service = AuditService(db)
-    audit_service.log_action(
-        user_id=new_user.id,
+    # Log registration (written in the background)
+    audit_queue.enqueue(
+        user_id=response.id,
         action="register",
         success=True,
         ip_address=get_client_ip(request) if request else None,
@@ -102,13 +116,13 @@ async def register(
         status_code=status.HTTP_201_CREATED,
     )
     
-    logger.info(f"New user registered: {new_user.username} (ID: {new_user.id})")
+    logger.info(f"New user registered: {response.username} (ID: {response.id})")
     
-    return new_user
+    return response
 
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     credentials: UserLogin,
     db: Session = Depends(get_db),
     request: Request = None
@@ -121,17 +135,45 @@ async def login(
     - Checks MFA requirements
     - Returns access and refresh tokens
     """
-    # Get user
-    user = db.query(User).filter(User.username == credentials.username).first()
+    # Get user (only the columns login needs - skips MFA secrets/backup codes)
+    user = db.execute(
+        select(User)
+        .where(User.username == credentials.username)
+        .options(load_only(
+            User.id,
+            User.username,
+            User.password_hash,
+            User.role,
+            User.is_active,
+            User.failed_login_attempts,
+        ))
+    ).scalar_one_or_none()
     
     ip_address = get_client_ip(request) if request else None
     user_agent = get_user_agent(request) if request else None
-    audit_service = AuditService(db)
     
-    # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Verify user exists and password is correct. Unknown usernames are
+    # checked against a dummy hash so both cases cost the same KDF work.
+    password_valid = verify_password(
+        credentials.password,
+        user.password_hash if user else dummy_password_hash()
+    )
+    if not user or not password_valid:
+        # Update failed login counter in place
+        if user:
+            db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(
+                    failed_login_attempts=User.failed_login_attempts + 1,
+                    last_failed_login=datetime.utcnow(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        
         # Log failed login
-        audit_service.log_action(
+        audit_queue.enqueue(
             user_id=user.id if user else None,
             action="login_failed",
             success=False,
@@ -141,12 +183,6 @@ async def login(
             status_code=status.HTTP_401_UNAUTHORIZED,
         )
         
-        # Update failed login counter
-        if user:
-            user.failed_login_attempts += 1
-            user.last_failed_login = datetime.utcnow()
-            db.commit()
-        
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -186,14 +222,32 @@ async def login(
         username=user.username
     )
     
+    user_id = user.id
+    username = user.username
+    
     # Update user login info
-    user.last_login = datetime.utcnow()
-    user.failed_login_attempts = 0  # Reset on successful login
+    login_values = {
+        "last_login": datetime.utcnow(),
+        "failed_login_attempts": 0,  # Reset on successful login
+    }
+    
+    # Transparently upgrade legacy bcrypt / outdated Argon2 hashes
+    if password_needs_rehash(user.password_hash):
+        login_values["password_hash"] = hash_password(credentials.password)
+    
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(**login_values)
+        .execution_options(synchronize_session=False)
+    )
+    
     db.commit()
+    user_cache.invalidate(user_id)
     
-    # Log successful login
-    audit_service.log_action(
-        user_id=user.id,
+    # Log successful login (written in the background)
+    audit_queue.enqueue(
+        user_id=user_id,
         action="login",
         success=True,
         risk_score=risk_score,
@@ -204,7 +258,7 @@ async def login(
         status_code=status.HTTP_200_OK,
     )
     
-    logger.info(f"User logged in: {user.username} (risk: {risk_score})")
+    logger.info(f"User logged in: {username} (risk: {risk_score})")
     
     return Token(
         access_token=access_token,
@@ -215,7 +269,7 @@ async def login(
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(
+def refresh_token(
     refresh_token: str,
     db: Session = Depends(get_db)
 ):
@@ -235,8 +289,8 @@ async def refresh_token(
     user_id = payload.get("user_id")
     username = payload.get("username")
     
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from database (primary key lookup)
+    user = db.get(User, user_id) if user_id is not None else None
     
     if not user or not user.is_active:
         raise HTTPException(
@@ -273,31 +327,40 @@ async def get_current_user_info(
     """
     Get current authenticated user's information.
     """
-    return current_user
+    # The user comes from the database - serialize it without re-validating
+    return ORJSONResponse(
+        {field: getattr(current_user, field) for field in _USER_RESPONSE_FIELDS}
+    )
 
 
 @router.get("/users", response_model=list[UserResponse])
-async def list_users(
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(require_admin),
+def list_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.MAX_PAGE_SIZE),
+    after_id: Optional[int] = Query(None, ge=0, description="Return users after this ID (keyset cursor)"),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
     List all users (admin only).
     
     - Requires admin role
-    - Supports pagination
+    - Supports pagination (`after_id` = last returned user ID)
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    query = select(*_USER_RESPONSE_COLUMNS).order_by(User.id)
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+    rows = db.execute(query.offset(skip).limit(limit)).all()
+    
+    # Rows already match UserResponse - serialize them directly
+    return ORJSONResponse([row._asdict() for row in rows])
 
 
 @router.put("/users/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_update: UserUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
@@ -306,7 +369,7 @@ async def update_user(
     - Requires admin role
     - Can update role, active status, MFA settings
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     
     if not user:
         raise HTTPException(
@@ -325,6 +388,8 @@ async def update_user(
         user.mfa_enabled = user_update.mfa_enabled
     
     db.commit()
+    user_cache.invalidate(user.id)
+    response_cache.invalidate("/admin/stats")
     db.refresh(user)
     
     logger.info(f"User {user.username} updated by admin {current_user.username}")
@@ -337,7 +402,7 @@ async def update_user(
 # ============================================================
 
 @router.post("/mfa/enroll")
-async def enroll_mfa(
+def enroll_mfa(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -349,7 +414,6 @@ async def enroll_mfa(
     - Generates backup codes
     """
     from app.services.mfa_service import MFAService
-    import json
     
     # Check if MFA is already enabled
     if current_user.mfa_enabled:
@@ -369,8 +433,9 @@ async def enroll_mfa(
     
     # Store secret and backup codes (temporarily, until verification)
     current_user.mfa_secret = secret
-    current_user.backup_codes = json.dumps(backup_codes)
+    current_user.backup_codes = [MFAService.hash_backup_code(c) for c in backup_codes]
     db.commit()
+    user_cache.invalidate(current_user.id)
     
     logger.info(f"MFA enrollment initiated for user: {current_user.username}")
     
@@ -383,7 +448,7 @@ async def enroll_mfa(
 
 
 @router.post("/mfa/verify")
-async def verify_mfa_enrollment(
+def verify_mfa_enrollment(
     code: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -414,6 +479,7 @@ async def verify_mfa_enrollment(
     # Enable MFA
     current_user.mfa_enabled = True
     db.commit()
+    user_cache.invalidate(current_user.id)
     
     logger.info(f"MFA successfully enabled for user: {current_user.username}")
     
@@ -424,7 +490,7 @@ async def verify_mfa_enrollment(
 
 
 @router.post("/mfa/login-verify")
-async def verify_mfa_login(
+def verify_mfa_login(
     username: str,
     code: str,
     db: Session = Depends(get_db)
@@ -436,9 +502,10 @@ async def verify_mfa_login(
     if the user has MFA enabled.
     """
     from app.services.mfa_service import MFAService
-    import json
     
-    user = db.query(User).filter(User.username == username).first()
+    user = db.execute(
+        select(User).where(User.username == username)
+    ).scalar_one_or_none()
     
     if not user:
         raise HTTPException(
@@ -457,13 +524,13 @@ async def verify_mfa_login(
     
     # If TOTP fails, check backup codes
     if not is_valid and user.backup_codes:
-        backup_codes = json.loads(user.backup_codes)
-        is_valid, updated_codes = MFAService.verify_backup_code(backup_codes, code)
+        is_valid, updated_codes = MFAService.verify_backup_code(user.backup_codes, code)
         
         if is_valid:
             # Update backup codes (remove used code)
-            user.backup_codes = json.dumps(updated_codes)
+            user.backup_codes = updated_codes
             db.commit()
+            user_cache.invalidate(user.id)
             logger.info(f"Backup code used for user: {username}")
     
     if not is_valid:
@@ -481,7 +548,7 @@ async def verify_mfa_login(
 
 
 @router.post("/mfa/disable")
-async def disable_mfa(
+def disable_mfa(
     password: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -504,6 +571,7 @@ async def disable_mfa(
     current_user.mfa_secret = None
     current_user.backup_codes = None
     db.commit()
+    user_cache.invalidate(current_user.id)
     
     logger.info(f"MFA disabled for user: {current_user.username}")
     
@@ -520,15 +588,7 @@ async def get_mfa_status(
     """
     Get MFA status for the current user.
     """
-    import json
-    
-    backup_count = 0
-    if current_user.backup_codes:
-        try:
-            backup_codes = json.loads(current_user.backup_codes)
-            backup_count = len(backup_codes)
-        except:
-            pass
+    backup_count = len(current_user.backup_codes) if current_user.backup_codes else 0
     
     return {
         "mfa_enabled": current_user.mfa_enabled,
@@ -8,9 +8,20 @@ Author: AI-Driven Adaptive Cryptographic Policy Engine
 Created: 2025-12-13
 """
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import Response
-from typing import List
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.database import SessionLocal, get_db
+from app.models.benchmark_run import BenchmarkRun
 
 from app.schemas.benchmark import (
     BenchmarkRunRequest,
@@ -19,7 +30,7 @@ from app.schemas.benchmark import (
     BenchmarkStatusSchema,
     ExportRequest
 )
-from benchmarks.benchmark_suite import run_comprehensive_suite
+from benchmarks.benchmark_suite import BenchmarkReport, BenchmarkResult, run_comprehensive_suite
 from benchmarks.report_generator import (
     generate_json_report,
     generate_csv_report,
@@ -32,8 +43,98 @@ from benchmarks.report_generator import (
 
 router = APIRouter(prefix="/benchmarks", tags=["benchmarks"])
 
-# In-memory storage for benchmark results (replace with database in production)
-_benchmark_results = []
+# Number of benchmark reports kept in the database (oldest are deleted)
+_MAX_STORED_RESULTS = 10
+
+# Benchmarks are CPU-bound and run for a long time: run them one at a time
+# in a dedicated worker process so the event loop (and the metrics being
+# measured) are not shared with API traffic
+_benchmark_slot = asyncio.Semaphore(1)
+_benchmark_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_benchmark_executor() -> ProcessPoolExecutor:
+    """Create the benchmark worker process on first use."""
+    global _benchmark_executor
+    if _benchmark_executor is None:
+        _benchmark_executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _benchmark_executor
+
+
+# Derived outputs of the latest report: kind -> ((run ID, created_at), output).
+# The run's timestamp is part of the key because IDs can be reused after
+# the results are cleared, and other workers never see that clear.
+_report_outputs: Dict[str, Tuple[Tuple[int, datetime], Any]] = {}
+
+
+def _to_report(data: Dict[str, Any]) -> BenchmarkReport:
+    """Rebuild the report dataclass from its stored JSON."""
+    return BenchmarkReport(
+        timestamp=data["timestamp"],
+        results=[BenchmarkResult(**result) for result in data["results"]],
+        summary=data["summary"],
+    )
+
+
+def _store_report(report: BenchmarkReport) -> None:
+    """Save a report and delete all but the newest _MAX_STORED_RESULTS."""
+    db = SessionLocal()
+    try:
+        db.add(BenchmarkRun(report=asdict(report)))
+        db.flush()
+        newest = (
+            select(BenchmarkRun.id)
+            .order_by(BenchmarkRun.id.desc())
+            .limit(_MAX_STORED_RESULTS)
+        )
+        db.execute(delete(BenchmarkRun).where(BenchmarkRun.id.not_in(newest)))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _latest_output(db: Session, kind: str, build: Callable[[BenchmarkReport], Any]) -> Any:
+    """
+    Build a chart/export output of the latest report, once per stored run.
+    
+    Only the latest run's ID and timestamp are queried when the output is
+    already cached.
+    
+    Raises:
+        HTTPException: If no results available
+    """
+    run_key = db.execute(
+        select(BenchmarkRun.id, BenchmarkRun.created_at)
+        .order_by(BenchmarkRun.id.desc())
+        .limit(1)
+    ).first()
+    if run_key is None:
+        raise HTTPException(
+            status_code=404,
+            detail="No benchmark results available. Run a benchmark first."
+        )
+    
+    entry = _report_outputs.get(kind)
+    if entry is not None and entry[0] == run_key:
+        return entry[1]
+    
+    data = db.execute(
+        select(BenchmarkRun.report).where(BenchmarkRun.id == run_key[0])
+    ).scalar_one()
+    output = build(_to_report(data))
+    _report_outputs[kind] = (run_key, output)
+    return output
+
+
+def shutdown_benchmark_executor() -> None:
+    """Stop the benchmark worker process, if it was started."""
+    global _benchmark_executor
+    if _benchmark_executor is not None:
+        _benchmark_executor.shutdown(cancel_futures=True)
+        _benchmark_executor = None
 
 # ============================================================================
 # API ENDPOINTS
@@ -61,15 +162,15 @@ async def run_benchmark(request: BenchmarkRunRequest = None):
         Response: { "timestamp": "...", "results": [...], "summary": {...} }
     """
     try:
-        # Run comprehensive benchmark suite
-        report = run_comprehensive_suite()
-        
-        # Store result (in production, save to database)
-        _benchmark_results.append(report)
+        # Run comprehensive benchmark suite (queued behind any run in progress)
+        async with _benchmark_slot:
+            report = await asyncio.get_running_loop().run_in_executor(
+                _get_benchmark_executor(),
+                run_comprehensive_suite,
+            )
         
-        # Keep only last 10 results
-        if len(_benchmark_results) > 10:
-            _benchmark_results.pop(0)
+        # Store result, shared by all workers; the oldest runs are deleted
+        await run_in_threadpool(_store_report, report)
         
         return report
     
@@ -81,7 +182,7 @@ async def run_benchmark(request: BenchmarkRunRequest = None):
 
 
 @router.get("/results", response_model=List[BenchmarkReportSchema])
-async def get_all_results():
+def get_all_results(db: Session = Depends(get_db)):
     """
     Get all stored benchmark results.
     
@@ -92,11 +193,18 @@ async def get_all_results():
         GET /api/v1/benchmarks/results
         Response: [{ "timestamp": "...", "results": [...] }, ...]
     """
-    return _benchmark_results
+    reports = db.execute(
+        select(BenchmarkRun.report)
+        .order_by(BenchmarkRun.id.desc())
+        .limit(_MAX_STORED_RESULTS)
+    ).scalars().all()
+    
+    # Stored reports already match the schema; oldest first
+    return ORJSONResponse(reports[::-1])
 
 
 @router.get("/results/latest", response_model=BenchmarkReportSchema)
-async def get_latest_result():
+def get_latest_result(db: Session = Depends(get_db)):
     """
     Get the most recent benchmark result.
     
@@ -110,17 +218,21 @@ async def get_latest_result():
         GET /api/v1/benchmarks/results/latest
         Response: { "timestamp": "...", "results": [...], "summary": {...} }
     """
-    if not _benchmark_results:
+    report = db.execute(
+        select(BenchmarkRun.report).order_by(BenchmarkRun.id.desc()).limit(1)
+    ).scalar_one_or_none()
+    
+    if report is None:
         raise HTTPException(
             status_code=404,
             detail="No benchmark results available. Run a benchmark first."
         )
     
-    return _benchmark_results[-1]
+    return ORJSONResponse(report)
 
 
 @router.get("/results/charts", response_model=ChartDataSchema)
-async def get_chart_data():
+def get_chart_data(db: Session = Depends(get_db)):
     """
     Get formatted data for frontend charts.
     
@@ -141,20 +253,13 @@ async def get_chart_data():
             "memory": [...]
         }
     """
-    if not _benchmark_results:
-        raise HTTPException(
-            status_code=404,
-            detail="No benchmark results available. Run a benchmark first."
-        )
-    
-    latest_report = _benchmark_results[-1]
-    chart_data = format_for_charts(latest_report)
+    chart_data = _latest_output(db, "charts", format_for_charts)
     
-    return chart_data
+    return ORJSONResponse(chart_data)
 
 
 @router.get("/export/json")
-async def export_json():
+def export_json(db: Session = Depends(get_db)):
     """
     Export latest benchmark results as JSON.
     
@@ -168,14 +273,7 @@ async def export_json():
         GET /api/v1/benchmarks/export/json
         Response: JSON file download
     """
-    if not _benchmark_results:
-        raise HTTPException(
-            status_code=404,
-            detail="No benchmark results available"
-        )
-    
-    latest_report = _benchmark_results[-1]
-    json_data = generate_json_report(latest_report)
+    json_data = _latest_output(db, "json", generate_json_report)
     
     return Response(
         content=json_data,
@@ -187,7 +285,7 @@ async def export_json():
 
 
 @router.get("/export/csv")
-async def export_csv():
+def export_csv(db: Session = Depends(get_db)):
     """
     Export latest benchmark results as CSV.
     
@@ -201,14 +299,7 @@ async def export_csv():
         GET /api/v1/benchmarks/export/csv
         Response: CSV file download
     """
-    if not _benchmark_results:
-        raise HTTPException(
-            status_code=404,
-            detail="No benchmark results available"
-        )
-    
-    latest_report = _benchmark_results[-1]
-    csv_data = generate_csv_report(latest_report)
+    csv_data = _latest_output(db, "csv", generate_csv_report)
     
     return Response(
         content=csv_data,
@@ -220,7 +311,7 @@ async def export_csv():
 
 
 @router.delete("/results/clear")
-async def clear_results():
+def clear_results(db: Session = Depends(get_db)):
     """
     Clear all stored benchmark results.
     
@@ -231,5 +322,7 @@ async def clear_results():
         DELETE /api/v1/benchmarks/results/clear
         Response: { "message": "All results cleared" }
     """
-    _benchmark_results.clear()
+    db.execute(delete(BenchmarkRun))
+    db.commit()
+    _report_outputs.clear()
     return {"message": "All benchmark results cleared successfully"}
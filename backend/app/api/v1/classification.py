@@ -11,9 +11,10 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.classification import ClassificationRequest, ClassificationResponse
 from app.api.deps import get_current_user
-from app.services.ml_classifier import MLClassifierService
+from app.services.ml_classifier import get_classifier
+from app.services.classifier_cache import classifier_cache
 from app.services.policy_engine import PolicyEngineService
-from app.services.audit_service import AuditService
+from app.services.audit_queue import audit_queue
 from app.utils.logger import logger
 
 
@@ -21,7 +22,7 @@ router = APIRouter(prefix="/classification", tags=["Classification"])
 
 
 @router.post("", response_model=ClassificationResponse)
-async def classify_data(
+def classify_data(
     request: ClassificationRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -33,12 +34,13 @@ async def classify_data(
     - Returns sensitivity level, confidence score, and applicable policy
     """
     # Initialize services
-    classifier = MLClassifierService(use_ml=request.use_ml)
+    classifier = get_classifier(use_ml=request.use_ml)
     policy_engine = PolicyEngineService(db)
-    audit_service = AuditService(db)
     
     # Classify text
-    sensitivity_level, confidence = classifier.classify(request.text)
+    sensitivity_level, confidence = classifier_cache.get_or_compute(
+        request.text, classifier.classify, use_ml=request.use_ml
+    )
     
     # Get policy for this sensitivity level
     policy = policy_engine.get_policy(sensitivity_level.value)
@@ -49,8 +51,8 @@ async def classify_data(
             detail=f"No policy configured for sensitivity level: {sensitivity_level.value}"
         )
     
-    # Log classification
-    audit_service.log_action(
+    # Log classification (written in the background)
+    audit_queue.enqueue(
         user_id=current_user.id,
         action="classify",
         success=True,
@@ -58,8 +60,8 @@ async def classify_data(
     )
     
     logger.info(
-        f"Classified data as {sensitivity_level.value} "
-        f"(confidence: {confidence:.2f}, user: {current_user.username})"
+        "Classified data as %s (confidence: %.2f, user: %s)",
+        sensitivity_level.value, confidence, current_user.username
     )
     
     return ClassificationResponse(
@@ -4,11 +4,12 @@ Encryption API Endpoints
 Handles encryption and decryption operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session, load_only
+from typing import Optional
 
 from app.database import get_db
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.models.data_classification import DataItem
 from app.schemas.classification import (
     EncryptionRequest,
@@ -19,16 +20,33 @@ from app.schemas.classification import (
 )
 from app.api.deps import get_current_user
 from app.services.encryption_service import EncryptionService
-from app.services.ml_classifier import MLClassifierService
-from app.services.audit_service import AuditService
+from app.services.ml_classifier import get_classifier
+from app.services.classifier_cache import classifier_cache
+from app.services.audit_queue import audit_queue
 from app.utils.logger import logger
+from app.config import settings
 
 
 router = APIRouter(prefix="/encryption", tags=["Encryption"])
 
+# Columns selected for data item metadata (DataItemResponse fields);
+# the is_encrypted/is_hashed properties are evaluated in SQL
+_DATA_ITEM_LIST_COLUMNS = (
+    DataItem.id,
+    DataItem.sensitivity_level,
+    DataItem.confidence_score,
+    (DataItem.encrypted_content.isnot(None) & DataItem.encryption_algorithm.isnot(None)).label("is_encrypted"),
+    DataItem.encryption_algorithm,
+    (DataItem.hash_value.isnot(None) & DataItem.hash_algorithm.isnot(None)).label("is_hashed"),
+    DataItem.hash_algorithm,
+    DataItem.is_signed,
+    DataItem.created_at,
+    DataItem.updated_at,
+)
+
 
 @router.post("/encrypt", response_model=EncryptionResponse)
-async def encrypt_data(
+def encrypt_data(
     request: EncryptionRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -42,7 +60,6 @@ async def encrypt_data(
     """
     # Initialize services
     encryption_service = EncryptionService(db)
-    audit_service = AuditService(db)
     
     # Determine sensitivity level
     if request.sensitivity_level:
@@ -50,14 +67,18 @@ async def encrypt_data(
         confidence_score = None
     else:
         # Auto-classify
-        classifier = MLClassifierService()
-        sensitivity_level, confidence_score = classifier.classify(request.text)
+        classifier = get_classifier()
+        sensitivity_level, confidence_score = classifier_cache.get_or_compute(
+            request.text, classifier.classify
+        )
+    
+    level_value = sensitivity_level.value
     
     # Check if user can access this sensitivity level
-    if not current_user.can_access_sensitivity(sensitivity_level.value):
+    if not current_user.can_access_sensitivity(level_value):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Insufficient permissions to encrypt {sensitivity_level.value} data"
+            detail=f"Insufficient permissions to encrypt {level_value} data"
         )
     
     # Encrypt and store
@@ -68,22 +89,24 @@ async def encrypt_data(
         confidence_score=confidence_score
     )
     
-    # Log encryption
-    audit_service.log_action(
+    data_id = data_item.id if request.save_to_db else None
+    
+    # Log encryption (written in the background)
+    audit_queue.enqueue(
         user_id=current_user.id,
         action="encrypt",
         success=True,
-        data_id=data_item.id if request.save_to_db else None,
+        data_id=data_id,
         status_code=status.HTTP_200_OK,
     )
     
     logger.info(
-        f"Encrypted data (ID: {data_item.id}, "
-        f"sensitivity: {sensitivity_level.value}, user: {current_user.username})"
+        "Encrypted data (ID: %s, sensitivity: %s, user: %s)",
+        data_item.id, level_value, current_user.username
     )
     
     return EncryptionResponse(
-        data_id=data_item.id if request.save_to_db else None,
+        data_id=data_id,
         sensitivity_level=sensitivity_level,
         encrypted_data=data_item.encrypted_content,
         encryption_algorithm=data_item.encryption_algorithm,
@@ -96,7 +119,7 @@ async def encrypt_data(
 
 
 @router.post("/decrypt", response_model=DecryptionResponse)
-async def decrypt_data(
+def decrypt_data(
     request: DecryptionRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -108,8 +131,11 @@ async def decrypt_data(
     - Decrypts and verifies integrity
     - Logs decryption attempt
     """
-    # Get data item
-    data_item = db.query(DataItem).filter(DataItem.id == request.data_id).first()
+    # Get data item (own data, or any data for admins)
+    query = db.query(DataItem).filter(DataItem.id == request.data_id)
+    if current_user.role != UserRole.ADMIN:
+        query = query.filter(DataItem.user_id == current_user.id)
+    data_item = query.first()
     
     if not data_item:
         raise HTTPException(
@@ -117,29 +143,22 @@ async def decrypt_data(
             detail="Data item not found"
         )
     
-    # Check ownership or admin access
-    if data_item.user_id != current_user.id and not current_user.has_permission(current_user.role):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to decrypt this data"
-        )
-    
     # Check sensitivity access
-    if not current_user.can_access_sensitivity(data_item.sensitivity_level.value):
+    level_value = data_item.sensitivity_level.value
+    if not current_user.can_access_sensitivity(level_value):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Insufficient permissions to access {data_item.sensitivity_level.value} data"
+            detail=f"Insufficient permissions to access {level_value} data"
         )
     
     # Decrypt
     encryption_service = EncryptionService(db)
-    audit_service = AuditService(db)
     
     try:
         result = encryption_service.decrypt_data(data_item)
         
         # Log successful decryption
-        audit_service.log_action(
+        audit_queue.enqueue(
             user_id=current_user.id,
             action="decrypt",
             success=True,
@@ -148,7 +167,7 @@ async def decrypt_data(
         )
         
         logger.info(
-            f"Decrypted data (ID: {data_item.id}, user: {current_user.username})"
+            "Decrypted data (ID: %s, user: %s)", data_item.id, current_user.username
         )
         
         return DecryptionResponse(
@@ -161,7 +180,7 @@ async def decrypt_data(
     
     except Exception as e:
         # Log failed decryption
-        audit_service.log_action(
+        audit_queue.enqueue(
             user_id=current_user.id,
             action="decrypt",
             success=False,
@@ -179,32 +198,30 @@ async def decrypt_data(
 
 
 @router.get("/data", response_model=list[DataItemResponse])
-async def list_user_data(
-    skip: int = 0,
-    limit: int = 50,
+def list_user_data(
+    limit: int = Query(50, ge=1, le=settings.MAX_PAGE_SIZE),
+    before_id: Optional[int] = Query(None, ge=1, description="Return items older than this ID (keyset cursor)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     List all encrypted data items for the current user.
     
-    - Returns user's own data
-    - Supports pagination
+    - Returns user's own data, newest first
+    - Supports pagination: pass the last returned ID as `before_id`
+      to fetch the next page without an OFFSET scan
     """
-    data_items = (
-        db.query(DataItem)
-        .filter(DataItem.user_id == current_user.id)
-        .order_by(DataItem.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = db.query(*_DATA_ITEM_LIST_COLUMNS).filter(DataItem.user_id == current_user.id)
+    if before_id is not None:
+        query = query.filter(DataItem.id < before_id)
     
-    return data_items
+    # IDs increase with creation time; only metadata columns are read,
+    # never the content or ciphertext
+    return query.order_by(DataItem.id.desc()).limit(limit).all()
 
 
 @router.get("/data/{data_id}", response_model=DataItemResponse)
-async def get_data_item(
+def get_data_item(
     data_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -214,7 +231,12 @@ async def get_data_item(
     
     - Returns metadata only (not decrypted content)
     """
-    data_item = db.query(DataItem).filter(DataItem.id == data_id).first()
+    # Ownership is part of the lookup; other users' items are not found
+    data_item = (
+        db.query(*_DATA_ITEM_LIST_COLUMNS)
+        .filter(DataItem.id == data_id, DataItem.user_id == current_user.id)
+        .first()
+    )
     
     if not data_item:
         raise HTTPException(
@@ -222,18 +244,11 @@ async def get_data_item(
             detail="Data item not found"
         )
     
-    # Check ownership
-    if data_item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
     return data_item
 
 
 @router.delete("/data/{data_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_data_item(
+def delete_data_item(
     data_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -243,7 +258,13 @@ async def delete_data_item(
     
     - User can only delete their own data
     """
-    data_item = db.query(DataItem).filter(DataItem.id == data_id).first()
+    # Ownership is part of the lookup; other users' items are not found
+    data_item = (
+        db.query(DataItem)
+        .options(load_only(DataItem.id))
+        .filter(DataItem.id == data_id, DataItem.user_id == current_user.id)
+        .first()
+    )
     
     if not data_item:
         raise HTTPException(
@@ -251,13 +272,6 @@ async def delete_data_item(
             detail="Data item not found"
         )
     
-    # Check ownership
-    if data_item.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
     db.delete(data_item)
     db.commit()
     
@@ -9,9 +9,8 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional
-import io
 
-from app.database import get_db
+from app.database import SessionLocal, get_db
 from app.models.user import User, UserRole
 from app.api.deps import get_current_user, require_role
 from app.services.export_service import ExportService
@@ -25,31 +24,32 @@ router = APIRouter(prefix="/export", tags=["Export"])
 async def export_audit_logs_csv(
     start_date: Optional[datetime] = Query(None, description="Start date filter"),
     end_date: Optional[datetime] = Query(None, description="End date filter"),
-    current_user: User = Depends(require_role(UserRole.ADMIN)),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(require_role(UserRole.ADMIN))
 ):
     """
     Export audit logs to CSV format (Admin only).
     
-    Downloads a CSV file containing filtered audit logs.
+    Downloads a CSV file containing filtered audit logs, streamed as it
+    is generated.
     """
-    export_service = ExportService(db)
-    
-    # Generate CSV
-    csv_content = export_service.export_audit_logs_csv(
-        start_date=start_date,
-        end_date=end_date
-    )
-    
-    # Create streaming response
-    output = io.BytesIO(csv_content.encode('utf-8'))
+    def csv_chunks():
+        # The request's session is closed before the body is streamed,
+        # so the export uses its own
+        db = SessionLocal()
+        try:
+            yield from ExportService(db).iter_audit_logs_csv(
+                start_date=start_date,
+                end_date=end_date
+            )
+        finally:
+            db.close()
     
     filename = f"audit_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
     logger.info(f"Admin {current_user.username} exported audit logs to CSV")
     
     return StreamingResponse(
-        iter([output.getvalue()]),
+        csv_chunks(),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -58,7 +58,7 @@ async def export_audit_logs_csv(
 
 
 @router.get("/compliance-report")
-async def get_compliance_report(
+def get_compliance_report(
     days: int = Query(30, description="Number of days to include in report"),
     current_user: User = Depends(require_role(UserRole.ADMIN)),
     db: Session = Depends(get_db)
@@ -84,7 +84,7 @@ async def get_compliance_report(
 
 
 @router.get("/data/{data_id}")
-async def export_data_item(
+def export_data_item(
     data_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
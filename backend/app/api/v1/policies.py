@@ -11,7 +11,7 @@ from app.database import get_db
 from app.models.user import User
 from app.models.encryption_policy import EncryptionPolicy
 from app.schemas.policy import PolicyResponse, PolicyUpdate
-from app.api.deps import get_current_user, require_admin
+from app.api.deps import get_current_user, ADMIN_DEP
 from app.services.policy_engine import PolicyEngineService
 from app.utils.logger import logger
 
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/policies", tags=["Policies"])
 
 
 @router.get("", response_model=list[PolicyResponse])
-async def list_policies(
+def list_policies(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -35,7 +35,7 @@ async def list_policies(
 
 
 @router.get("/{sensitivity_level}", response_model=PolicyResponse)
-async def get_policy(
+def get_policy(
     sensitivity_level: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -56,10 +56,10 @@ async def get_policy(
 
 
 @router.put("/{sensitivity_level}", response_model=PolicyResponse)
-async def update_policy(
+def update_policy(
     sensitivity_level: str,
     policy_update: PolicyUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: User = ADMIN_DEP,
     db: Session = Depends(get_db)
 ):
     """
@@ -70,8 +70,8 @@ async def update_policy(
     """
     policy_engine = PolicyEngineService(db)
     
-    # Convert Pydantic model to dict, excluding None values
-    updates = policy_update.dict(exclude_none=True)
+    # Only the fields the client sent (None values are ignored)
+    updates = policy_update.model_dump(exclude_unset=True, exclude_none=True)
     
     updated_policy = policy_engine.update_policy(sensitivity_level, updates)
     
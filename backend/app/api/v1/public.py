@@ -6,8 +6,9 @@ Anyone can encrypt files and share them via cryptographic links.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-import base64
+import pybase64
 
 from app.database import get_db
 from app.schemas.share import (
@@ -22,19 +23,21 @@ from app.schemas.share import (
     SensitivityLevel,
 )
 from app.services.share_service import ShareService
-from app.services.ml_classifier import MLClassifierService
-from app.services.explainability_service import ExplainabilityService
+from app.services.ml_classifier import get_classifier
+from app.services.classifier_cache import classifier_cache
+from app.services.explainability_service import get_explainer
 from app.utils.logger import logger
+from app.config import settings
 
 
 router = APIRouter(prefix="/public", tags=["Public"])
 
+# Bytes of an uploaded file used for auto-classification
+_CLASSIFY_PREVIEW_BYTES = 10000
+
 
 @router.post("/classify", response_model=ClassifyResponse)
-async def classify_text(
-    request: ClassifyRequest,
-    db: Session = Depends(get_db)
-):
+def classify_text(request: ClassifyRequest):
     """
     Classify text for sensitivity level (public endpoint).
     
@@ -45,11 +48,13 @@ async def classify_text(
     """
     try:
         # Classify using ML
-        classifier = MLClassifierService()
-        sensitivity_level, confidence_score = classifier.classify(request.text)
+        classifier = get_classifier()
+        sensitivity_level, confidence_score = classifier_cache.get_or_compute(
+            request.text, classifier.classify
+        )
         
         # Generate explanation
-        explainer = ExplainabilityService()
+        explainer = get_explainer()
         explanation = explainer.explain_classification(
             text=request.text,
             sensitivity_level=sensitivity_level,
@@ -57,46 +62,13 @@ async def classify_text(
         )
         
         logger.info(
-            f"Classified text: {sensitivity_level.value} "
-            f"(confidence: {confidence_score:.2f}, "
-            f"patterns: {len(explanation.detected_patterns)})"
+            "Classified text: %s (confidence: %.2f, patterns: %d)",
+            sensitivity_level.value, confidence_score, len(explanation.detected_patterns)
         )
         
-        # Convert dataclasses to dicts for response
-        return ClassifyResponse(
-            sensitivity_level=sensitivity_level,
-            confidence_score=confidence_score,
-            explanation=explanation.explanation,
-            detected_patterns=[
-                {
-                    "type": p.type,
-                    "count": p.count,
-                    "confidence": p.confidence,
-                    "examples": p.examples,
-                    "contribution": p.contribution,
-                    "severity": p.severity
-                }
-                for p in explanation.detected_patterns
-            ],
-            feature_importance=[
-                {
-                    "feature": f.feature,
-                    "importance": f.importance,
-                    "description": f.description
-                }
-                for f in explanation.feature_importance
-            ],
-            highlighted_regions=[
-                {
-                    "start": r.start,
-                    "end": r.end,
-                    "type": r.type,
-                    "severity": r.severity,
-                    "text": r.text
-                }
-                for r in explanation.highlighted_regions
-            ]
-        )
+        # ExplanationResult has the ClassifyResponse fields; orjson serializes
+        # the dataclasses directly, without per-item dicts or revalidation
+        return ORJSONResponse(explanation)
     except Exception as e:
         logger.error(f"Classification failed: {e}")
         raise HTTPException(
@@ -106,7 +78,7 @@ async def classify_text(
 
 
 @router.post("/encrypt", response_model=PublicEncryptResponse)
-async def encrypt_file(
+def encrypt_file(
     request: PublicEncryptRequest,
     db: Session = Depends(get_db)
 ):
@@ -119,9 +91,9 @@ async def encrypt_file(
     - Supports password protection, expiration, download limits
     """
     try:
-        # Decode base64 content
+        # Decode base64 content (SIMD decoder, same lenient parsing as the stdlib)
         try:
-            content = base64.b64decode(request.content)
+            content = pybase64.b64decode(request.content, validate=False)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -133,10 +105,12 @@ async def encrypt_file(
             sensitivity_level = request.sensitivity_level
             confidence_score = None
         else:
-            # Auto-classify using content preview (first 10KB)
-            preview_text = content[:10000].decode('utf-8', errors='ignore')
-            classifier = MLClassifierService()
-            sensitivity_level, confidence_score = classifier.classify(preview_text)
+            # Auto-classify using content preview (first 10KB, decoded without copying)
+            preview_text = str(memoryview(content)[:_CLASSIFY_PREVIEW_BYTES], 'utf-8', 'ignore')
+            classifier = get_classifier()
+            sensitivity_level, confidence_score = classifier_cache.get_or_compute(
+                preview_text, classifier.classify
+            )
         
         # Create share link
         share_service = ShareService(db)
@@ -152,12 +126,11 @@ async def encrypt_file(
         )
         
         # Build share URL
-        # TODO: Get base URL from config
-        share_url = f"http://localhost:3000/share/{share_link.share_token}"
+        share_url = settings.SHARE_BASE_URL + share_link.share_token
         
         logger.info(
-            f"Created public share: {share_link.share_token} "
-            f"(sensitivity: {sensitivity_level.value})"
+            "Created public share: %s (sensitivity: %s)",
+            share_link.share_token, sensitivity_level.value
         )
         
         return PublicEncryptResponse(
@@ -180,7 +153,7 @@ async def encrypt_file(
 
 
 @router.get("/share/{token}/info", response_model=ShareInfoResponse)
-async def get_share_info(
+def get_share_info(
     token: str,
     db: Session = Depends(get_db)
 ):
@@ -218,7 +191,7 @@ async def get_share_info(
 
 
 @router.post("/decrypt/{token}", response_model=DecryptResponse)
-async def decrypt_share(
+def decrypt_share(
     token: str,
     request: DecryptRequest,
     db: Session = Depends(get_db)
@@ -249,7 +222,7 @@ async def decrypt_share(
         logger.info(f"Successfully decrypted share: {token}")
         
         return DecryptResponse(
-            content=base64.b64encode(result["content"]).decode('utf-8'),
+            content=pybase64.b64encode_as_string(result["content"]),
             filename=result["filename"],
             content_type=result["content_type"],
             hash_verified=result["hash_verified"],
@@ -6,6 +6,7 @@ including database connection, JWT settings, cryptographic parameters,
 and security configurations.
 """
 
+from functools import cached_property
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -23,12 +24,36 @@ class Settings(BaseSettings):
     APP_NAME: str = "Adaptive Crypto Policy Engine"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
+    WORKERS: int = Field(
+        default=1,
+        description="Uvicorn worker processes (in-process caches are per worker)"
+    )
+    THREADPOOL_SIZE: Optional[int] = Field(
+        default=None,
+        description="Threads running sync endpoints (crypto, DB); default max(40, 4 x CPU cores)"
+    )
     
     # Database Settings
     DATABASE_URL: str = Field(
         default="sqlite:///./adaptive_crypto.db",
         description="SQLite database connection string"
     )
+    DB_POOL_SIZE: int = Field(
+        default=0,
+        description="Persistent connections kept in the pool (0 = min(CPU count * 4, 40))"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=-1,
+        description="Extra connections allowed under load (-1 = 2 * pool size)"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=5,
+        description="Seconds to wait for a free connection before failing"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Recycle connections older than this many seconds"
+    )
     
     # JWT Settings
     SECRET_KEY: str = Field(
@@ -38,12 +63,40 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60  # 1 hour
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7  # 7 days
+    TOKEN_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        description="How long decoded access tokens are cached in-process (0 disables the cache)"
+    )
+    USER_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        description="How long authenticated users are cached in-process (0 disables the cache)"
+    )
     
     # Security Settings
     BCRYPT_ROUNDS: int = Field(
         default=12,
         description="Cost factor for bcrypt hashing (higher = more secure but slower)"
     )
+    ARGON2_TIME_COST: int = Field(
+        default=3,
+        description="Argon2id iterations for password hashing"
+    )
+    ARGON2_MEMORY_COST: int = Field(
+        default=65536,
+        description="Argon2id memory cost in KiB (65536 = 64 MiB)"
+    )
+    ARGON2_PARALLELISM: int = Field(
+        default=2,
+        description="Argon2id lanes (threads) per hash"
+    )
+    PASSWORD_VERIFY_CACHE_TTL_SECONDS: int = Field(
+        default=15,
+        description="How long successful password verifications are cached (0 disables the cache)"
+    )
+    KDF_MAX_CONCURRENCY: int = Field(
+        default=0,
+        description="Maximum concurrent password hash operations (0 = CPU count / ARGON2_PARALLELISM)"
+    )
     
     # Password Requirements
     MIN_PASSWORD_LENGTH: int = 8
@@ -73,6 +126,10 @@ class Settings(BaseSettings):
     # ML Model Settings
     ML_MODEL_PATH: str = "./ml_models/distilbert"
     ML_CONFIDENCE_THRESHOLD: float = 0.85
+    CLASSIFIER_CACHE_SIZE: int = Field(
+        default=10000,
+        description="Classification results cached by text digest (0 disables the cache)"
+    )
     
     # CORS Settings
     CORS_ORIGINS: str = Field(
@@ -80,15 +137,35 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed CORS origins"
     )
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS_ORIGINS string into list"""
+        """Parse CORS_ORIGINS string into list (once per settings instance)"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
+    # Public Share Links
+    SHARE_BASE_URL: str = Field(
+        default="http://localhost:3000/share/",
+        description="Frontend URL prefix for public share links (the share token is appended)"
+    )
+    
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FILE: str = "./logs/app.log"
     
+    # Audit Log Batching
+    AUDIT_BATCH_SIZE: int = Field(
+        default=500,
+        description="Maximum audit log entries written per INSERT"
+    )
+    AUDIT_FLUSH_INTERVAL_MS: int = Field(
+        default=250,
+        description="Maximum time an audit log entry waits before being written"
+    )
+    AUDIT_QUEUE_MAX_SIZE: int = Field(
+        default=10000,
+        description="Queued audit entries before new entries are written synchronously"
+    )
+    
     # Business Hours (for risk calculation)
     BUSINESS_START_HOUR: int = 9  # 9 AM
     BUSINESS_END_HOUR: int = 18  # 6 PM
@@ -6,12 +6,16 @@ This package contains core security, authentication, and cryptographic utilities
 
 from app.core.crypto import (
     generate_aes_key,
+    aes_encrypt_bytes,
+    aes_decrypt_bytes,
     aes_encrypt,
+    aes_encrypt_many,
     aes_decrypt,
     generate_rsa_keypair,
     rsa_encrypt,
     rsa_decrypt,
     sha256_hash,
+    sha256_hash_many,
     sha512_hash,
     verify_hash,
     sign_data,
@@ -24,12 +28,14 @@ from app.core.jwt import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    decode_access_token,
     verify_token_type,
 )
 
 from app.core.security import (
     hash_password,
     verify_password,
+    password_needs_rehash,
     calculate_risk_score,
     requires_mfa,
     mfa_recommended,
@@ -39,12 +45,16 @@ from app.core.security import (
 __all__ = [
     # Crypto
     "generate_aes_key",
+    "aes_encrypt_bytes",
+    "aes_decrypt_bytes",
     "aes_encrypt",
+    "aes_encrypt_many",
     "aes_decrypt",
     "generate_rsa_keypair",
     "rsa_encrypt",
     "rsa_decrypt",
     "sha256_hash",
+    "sha256_hash_many",
     "sha512_hash",
     "verify_hash",
     "sign_data",
@@ -55,10 +65,12 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "decode_access_token",
     "verify_token_type",
     # Security
     "hash_password",
     "verify_password",
+    "password_needs_rehash",
     "calculate_risk_score",
     "requires_mfa",
     "mfa_recommended",
@@ -12,19 +12,85 @@ All functions use best practices from the Python cryptography library.
 """
 
 import os
-import base64
-from typing import Tuple, Dict, Optional
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+import pybase64
+import hashlib
+import hmac
+from functools import lru_cache
+from typing import Tuple, Dict, Iterable, List, Optional
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.asymmetric import ec, rsa, padding
 from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.asymmetric.rsa import (
     RSAPrivateKey,
     RSAPublicKey,
 )
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
 from cryptography.exceptions import InvalidSignature, InvalidTag
 
 
+# ============================================================
+# Padding and Signature Schemes
+# ============================================================
+
+# Immutable, so built once and shared by every call
+_SHA512 = hashes.SHA512()
+_OAEP_SHA256 = padding.OAEP(
+    mgf=padding.MGF1(algorithm=hashes.SHA256()),
+    algorithm=hashes.SHA256(),
+    label=None
+)
+_PSS_SHA512 = padding.PSS(
+    mgf=padding.MGF1(_SHA512),
+    salt_length=padding.PSS.MAX_LENGTH
+)
+_ECDSA_SHA512 = ec.ECDSA(_SHA512)
+
+
+# ============================================================
+# AEAD Cipher Cache
+# ============================================================
+
+# Cipher objects keep their initialized key context, so repeated
+# operations with the same key skip the key setup
+_CIPHER_CACHE_SIZE = 256
+
+# AES-GCM and ChaCha20-Poly1305 append a 16-byte tag to the ciphertext
+_AEAD_TAG_SIZE = 16
+
+
+@lru_cache(maxsize=_CIPHER_CACHE_SIZE)
+def _aesgcm(key: bytes) -> AESGCM:
+    """Get the AES-GCM cipher for a key (cached)."""
+    return AESGCM(key)
+
+
+@lru_cache(maxsize=_CIPHER_CACHE_SIZE)
+def _chacha20poly1305(key: bytes) -> ChaCha20Poly1305:
+    """Get the ChaCha20-Poly1305 cipher for a key (cached)."""
+    return ChaCha20Poly1305(key)
+
+
+def _split_tag(ciphertext_and_tag: bytes) -> Tuple[memoryview, memoryview]:
+    """Split AEAD output into (ciphertext, tag) views without copying."""
+    view = memoryview(ciphertext_and_tag)
+    return view[:-_AEAD_TAG_SIZE], view[-_AEAD_TAG_SIZE:]
+
+
+def clear_cipher_cache() -> None:
+    """
+    Drop all cached cipher objects.
+    
+    The cache holds up to 256 recently used keys per algorithm in memory;
+    call this when keys must not outlive their use (e.g. key rotation).
+    """
+    _aesgcm.cache_clear()
+    _chacha20poly1305.cache_clear()
+
+
 # ============================================================
 # AES-256-GCM Symmetric Encryption
 # ============================================================
@@ -49,6 +115,64 @@ def generate_aes_key(key_size: int = 256) -> bytes:
     return os.urandom(key_bytes)
 
 
+def _aes_encrypt_views(plaintext: bytes, key: bytes) -> Tuple[bytes, memoryview, memoryview]:
+    """
+    AES-GCM encrypt for callers that base64-encode the result right away.
+    
+    Returns:
+        tuple: (nonce, ciphertext, tag); ciphertext and tag are memoryviews
+            of the single buffer returned by the cipher (no copies)
+    """
+    # Generate random 96-bit nonce (12 bytes is recommended for GCM)
+    nonce = os.urandom(12)
+    
+    # Encrypt (GCM mode returns ciphertext + tag combined); in AESGCM the
+    # tag is appended to the ciphertext (last 16 bytes)
+    ciphertext_and_tag = _aesgcm(bytes(key)).encrypt(nonce, plaintext, None)
+    return (nonce, *_split_tag(ciphertext_and_tag))
+
+
+def aes_encrypt_bytes(plaintext: bytes, key: bytes) -> Tuple[bytes, bytes, bytes]:
+    """
+    Encrypt raw bytes using AES-GCM (authenticated encryption).
+    
+    Bytes in, bytes out: callers that store or send the result encode it
+    themselves (see aes_encrypt for the base64 form).
+    
+    Args:
+        plaintext: Data to encrypt
+        key: AES key (16, 24 or 32 bytes)
+        
+    Returns:
+        tuple: (nonce, ciphertext, tag)
+    """
+    nonce, ciphertext, tag = _aes_encrypt_views(plaintext, key)
+    return nonce, bytes(ciphertext), bytes(tag)
+
+
+def aes_decrypt_bytes(ciphertext: bytes, key: bytes, nonce: bytes, tag: bytes) -> bytes:
+    """
+    Decrypt AES-GCM encrypted raw bytes.
+    
+    Args:
+        ciphertext: Encrypted data
+        key: AES key (raw bytes)
+        nonce: Nonce used for encryption
+        tag: Authentication tag
+        
+    Returns:
+        bytes: Decrypted data
+        
+    Raises:
+        ValueError: If authentication fails (data tampered with)
+    """
+    # Reconstruct ciphertext + tag (AESGCM expects them together)
+    try:
+        return _aesgcm(bytes(key)).decrypt(nonce, ciphertext + tag, None)
+    except InvalidTag:
+        raise ValueError("Authentication failed: data may have been tampered with")
+
+
 def aes_encrypt(
     plaintext: str,
     key: Optional[bytes] = None
@@ -83,36 +207,54 @@ def aes_encrypt(
     else:
         include_key = False
     
-    # Generate random 96-bit nonce (12 bytes is recommended for GCM)
-    nonce = os.urandom(12)
-    
-    # Create AESGCM cipher
-    aesgcm = AESGCM(key)
-    
-    # Encrypt (GCM mode returns ciphertext + tag combined)
-    plaintext_bytes = plaintext.encode('utf-8')
-    ciphertext_and_tag = aesgcm.encrypt(nonce, plaintext_bytes, None)
-    
-    # In AESGCM, the tag is appended to the ciphertext
-    # Separate them for clarity (tag is last 16 bytes)
-    ciphertext = ciphertext_and_tag[:-16]
-    tag = ciphertext_and_tag[-16:]
+    nonce, ciphertext, tag = _aes_encrypt_views(plaintext.encode('utf-8'), key)
     
-    # Build result dictionary
+    # Build result dictionary (base64 only at this string boundary)
     result = {
-        "ciphertext": base64.b64encode(ciphertext).decode('utf-8'),
-        "nonce": base64.b64encode(nonce).decode('utf-8'),
-        "tag": base64.b64encode(tag).decode('utf-8'),
+        "ciphertext": pybase64.b64encode_as_string(ciphertext),
+        "nonce": pybase64.b64encode_as_string(nonce),
+        "tag": pybase64.b64encode_as_string(tag),
         "algorithm": "AES-256-GCM",
     }
     
     # Include key only if we generated it
     if include_key:
-        result["key"] = base64.b64encode(key).decode('utf-8')
+        result["key"] = pybase64.b64encode_as_string(key)
     
     return result
 
 
+def aes_encrypt_many(plaintexts: List[str], key: bytes) -> List[Dict[str, str]]:
+    """
+    Encrypt many plaintexts with the same AES-256-GCM key.
+    
+    The cipher is set up once and the nonces for all plaintexts are read
+    from the OS random source in a single call.
+    
+    Args:
+        plaintexts: Strings to encrypt
+        key: AES key (raw bytes)
+        
+    Returns:
+        list: One dict per plaintext, in order, with the same fields as
+            aes_encrypt (ciphertext, nonce, tag, algorithm; never the key)
+    """
+    encrypt = _aesgcm(bytes(key)).encrypt
+    nonces = os.urandom(12 * len(plaintexts))
+    
+    results = []
+    for offset, plaintext in zip(range(0, len(nonces), 12), plaintexts):
+        nonce = nonces[offset:offset + 12]
+        ciphertext, tag = _split_tag(encrypt(nonce, plaintext.encode('utf-8'), None))
+        results.append({
+            "ciphertext": pybase64.b64encode_as_string(ciphertext),
+            "nonce": pybase64.b64encode_as_string(nonce),
+            "tag": pybase64.b64encode_as_string(tag),
+            "algorithm": "AES-256-GCM",
+        })
+    return results
+
+
 def aes_decrypt(
     ciphertext: str,
     key: bytes,
@@ -132,26 +274,15 @@ def aes_decrypt(
         str: Decrypted plaintext
         
     Raises:
-        InvalidTag: If authentication fails (data tampered with)
-        ValueError: If decoding fails
+        ValueError: If authentication or decoding fails
     """
-    # Decode from base64
-    ciphertext_bytes = base64.b64decode(ciphertext)
-    nonce_bytes = base64.b64decode(nonce)
-    tag_bytes = base64.b64decode(tag)
-    
-    # Reconstruct ciphertext + tag (AESGCM expects them together)
-    ciphertext_and_tag = ciphertext_bytes + tag_bytes
-    
-    # Create AESGCM cipher
-    aesgcm = AESGCM(key)
-    
-    # Decrypt and verify tag
-    try:
-        plaintext_bytes = aesgcm.decrypt(nonce_bytes, ciphertext_and_tag, None)
-        return plaintext_bytes.decode('utf-8')
-    except InvalidTag:
-        raise ValueError("Authentication failed: data may have been tampered with")
+    plaintext_bytes = aes_decrypt_bytes(
+        pybase64.b64decode(ciphertext),
+        key,
+        pybase64.b64decode(nonce),
+        pybase64.b64decode(tag),
+    )
+    return plaintext_bytes.decode('utf-8')
 
 
 # ============================================================
@@ -176,8 +307,7 @@ def generate_rsa_keypair(key_size: int = 2048) -> Tuple[RSAPrivateKey, RSAPublic
     
     private_key = rsa.generate_private_key(
         public_exponent=65537,
-        key_size=key_size,
-        backend=default_backend()
+        key_size=key_size
     )
     public_key = private_key.public_key()
     
@@ -206,14 +336,10 @@ def rsa_encrypt(plaintext: str, public_key: RSAPublicKey) -> str:
     # Encrypt with OAEP padding (recommended)
     ciphertext = public_key.encrypt(
         plaintext_bytes,
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None
-        )
+        _OAEP_SHA256
     )
     
-    return base64.b64encode(ciphertext).decode('utf-8')
+    return pybase64.b64encode_as_string(ciphertext)
 
 
 def rsa_decrypt(ciphertext: str, private_key: RSAPrivateKey) -> str:
@@ -230,16 +356,12 @@ def rsa_decrypt(ciphertext: str, private_key: RSAPrivateKey) -> str:
     Raises:
         ValueError: If decryption fails
     """
-    ciphertext_bytes = base64.b64decode(ciphertext)
+    ciphertext_bytes = pybase64.b64decode(ciphertext)
     
     # Decrypt with OAEP padding
     plaintext_bytes = private_key.decrypt(
         ciphertext_bytes,
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None
-        )
+        _OAEP_SHA256
     )
     
     return plaintext_bytes.decode('utf-8')
@@ -259,12 +381,21 @@ def sha256_hash(data: str) -> str:
     Returns:
         str: Hexadecimal hash digest
     """
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.hashes import Hash
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def sha256_hash_many(items: Iterable[bytes]) -> List[str]:
+    """
+    Compute SHA-256 hashes of many byte strings.
     
-    digest = Hash(hashes.SHA256(), backend=default_backend())
-    digest.update(data.encode('utf-8'))
-    return digest.finalize().hex()
+    Args:
+        items: Data to hash (e.g. file chunks)
+        
+    Returns:
+        list: Hexadecimal hash digest of each item, in order
+    """
+    sha256 = hashlib.sha256
+    return [sha256(item).hexdigest() for item in items]
 
 
 def sha512_hash(data: str) -> str:
@@ -277,12 +408,28 @@ def sha512_hash(data: str) -> str:
     Returns:
         str: Hexadecimal hash digest
     """
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.hashes import Hash
+    return hashlib.sha512(data.encode('utf-8')).hexdigest()
+
+
+_HASH_FUNCTIONS = {"SHA-256": hashlib.sha256, "SHA-512": hashlib.sha512}
+
+
+def _verify_digest(data: str, hash_value: str, hash_function) -> bool:
+    """
+    Compare the raw digest of data with a hexadecimal hash.
     
-    digest = Hash(hashes.SHA512(), backend=default_backend())
-    digest.update(data.encode('utf-8'))
-    return digest.finalize().hex()
+    Decoding the expected hash once halves the bytes compared and skips
+    hex-encoding the computed digest. Malformed hashes never match.
+    """
+    if not hash_value:
+        return False
+    try:
+        expected = bytes.fromhex(hash_value)
+    except ValueError:
+        return False
+    
+    # Constant-time comparison to prevent timing attacks
+    return hmac.compare_digest(hash_function(data.encode('utf-8')).digest(), expected)
 
 
 def verify_hash(data: str, hash_value: str, algorithm: str = "SHA-256") -> bool:
@@ -300,15 +447,11 @@ def verify_hash(data: str, hash_value: str, algorithm: str = "SHA-256") -> bool:
     Raises:
         ValueError: If algorithm is unsupported
     """
-    if algorithm.upper() == "SHA-256":
-        computed_hash = sha256_hash(data)
-    elif algorithm.upper() == "SHA-512":
-        computed_hash = sha512_hash(data)
-    else:
+    hash_function = _HASH_FUNCTIONS.get(algorithm.upper())
+    if hash_function is None:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
     
-    # Constant-time comparison to prevent timing attacks
-    return computed_hash == hash_value
+    return _verify_digest(data, hash_value, hash_function)
 
 
 # ============================================================
@@ -330,16 +473,9 @@ def sign_data(data: str, private_key: RSAPrivateKey) -> str:
     """
     data_bytes = data.encode('utf-8')
     
-    signature = private_key.sign(
-        data_bytes,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA512()),
-            salt_length=padding.PSS.MAX_LENGTH
-        ),
-        hashes.SHA512()
-    )
+    signature = private_key.sign(data_bytes, _PSS_SHA512, _SHA512)
     
-    return base64.b64encode(signature).decode('utf-8')
+    return pybase64.b64encode_as_string(signature)
 
 
 def verify_signature(data: str, signature: str, public_key: RSAPublicKey) -> bool:
@@ -354,18 +490,21 @@ def verify_signature(data: str, signature: str, public_key: RSAPublicKey) -> boo
     Returns:
         bool: True if signature is valid
     """
+    signature_bytes = pybase64.b64decode(signature)
+    
+    # A valid signature is exactly one modulus long; reject anything else
+    # before paying for the modular exponentiation
+    if len(signature_bytes) != (public_key.key_size + 7) // 8:
+        return False
+    
     data_bytes = data.encode('utf-8')
-    signature_bytes = base64.b64decode(signature)
     
     try:
         public_key.verify(
             signature_bytes,
             data_bytes,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA512()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA512()
+            _PSS_SHA512,
+            _SHA512
         )
         return True
     except InvalidSignature:
@@ -398,7 +537,7 @@ def serialize_private_key(private_key: RSAPrivateKey, password: Optional[bytes]
         encryption_algorithm=encryption
     )
     
-    return pem.decode('utf-8')
+    return pem.decode('ascii')
 
 
 def serialize_public_key(public_key: RSAPublicKey) -> str:
@@ -416,7 +555,7 @@ def serialize_public_key(public_key: RSAPublicKey) -> str:
         format=serialization.PublicFormat.SubjectPublicKeyInfo
     )
     
-    return pem.decode('utf-8')
+    return pem.decode('ascii')
 
 
 def load_private_key(pem_data: str, password: Optional[bytes] = None) -> RSAPrivateKey:
@@ -432,8 +571,7 @@ def load_private_key(pem_data: str, password: Optional[bytes] = None) -> RSAPriv
     """
     return serialization.load_pem_private_key(
         pem_data.encode('utf-8'),
-        password=password,
-        backend=default_backend()
+        password=password
     )
 
 
@@ -447,16 +585,17 @@ def load_public_key(pem_data: str) -> RSAPublicKey:
     Returns:
         RSAPublicKey: Loaded public key
     """
-    return serialization.load_pem_public_key(
-        pem_data.encode('utf-8'),
-        backend=default_backend()
-    )
+    return serialization.load_pem_public_key(pem_data.encode('utf-8'))
 
 
 # ============================================================
 # Hybrid Encryption (AES + RSA for large data)
 # ============================================================
 
+# Length of a base64-encoded AES-256 key, as wrapped by older hybrid_encrypt
+_LEGACY_WRAPPED_KEY_SIZE = 44
+
+
 def hybrid_encrypt(plaintext: str, public_key: RSAPublicKey) -> Dict[str, str]:
     """
     Hybrid encryption: Encrypt data with AES, then encrypt AES key with RSA.
@@ -471,22 +610,22 @@ def hybrid_encrypt(plaintext: str, public_key: RSAPublicKey) -> Dict[str, str]:
     Returns:
         dict: Contains:
             - encrypted_data: AES encrypted data (base64)
-            - encrypted_key: RSA encrypted AES key (base64)
+            - encrypted_key: RSA encrypted raw AES key (base64)
             - nonce: AES nonce (base64)
             - tag: AES authentication tag (base64)
     """
-    # Step 1: Encrypt data with AES
-    aes_result = aes_encrypt(plaintext)
+    # Step 1: Encrypt data with AES (bytes in, base64 only for the result)
+    aes_key = generate_aes_key(256)
+    nonce, ciphertext, tag = _aes_encrypt_views(plaintext.encode('utf-8'), aes_key)
     
-    # Step 2: Encrypt the AES key with RSA
-    aes_key_b64 = aes_result["key"]
-    encrypted_aes_key = rsa_encrypt(aes_key_b64, public_key)
+    # Step 2: Encrypt the raw AES key with RSA
+    encrypted_aes_key = public_key.encrypt(aes_key, _OAEP_SHA256)
     
     return {
-        "encrypted_data": aes_result["ciphertext"],
-        "encrypted_key": encrypted_aes_key,
-        "nonce": aes_result["nonce"],
-        "tag": aes_result["tag"],
+        "encrypted_data": pybase64.b64encode_as_string(ciphertext),
+        "encrypted_key": pybase64.b64encode_as_string(encrypted_aes_key),
+        "nonce": pybase64.b64encode_as_string(nonce),
+        "tag": pybase64.b64encode_as_string(tag),
         "algorithm": "Hybrid-AES-256-GCM-RSA-2048"
     }
 
@@ -501,6 +640,8 @@ def hybrid_decrypt(
     """
     Decrypt hybrid encrypted data.
     
+    Keys wrapped as base64 text (before the raw key wrap) are still accepted.
+    
     Args:
         encrypted_data: AES encrypted data (base64)
         encrypted_key: RSA encrypted AES key (base64)
@@ -512,8 +653,9 @@ def hybrid_decrypt(
         str: Decrypted plaintext
     """
     # Step 1: Decrypt the AES key using RSA
-    aes_key_b64 = rsa_decrypt(encrypted_key, private_key)
-    aes_key = base64.b64decode(aes_key_b64)
+    aes_key = private_key.decrypt(pybase64.b64decode(encrypted_key), _OAEP_SHA256)
+    if len(aes_key) == _LEGACY_WRAPPED_KEY_SIZE:
+        aes_key = pybase64.b64decode(aes_key)
     
     # Step 2: Decrypt the data using AES
     plaintext = aes_decrypt(encrypted_data, aes_key, nonce, tag)
@@ -557,8 +699,6 @@ def chacha20_encrypt(
             - tag: Base64 encoded authentication tag
             - algorithm: "ChaCha20-Poly1305"
     """
-    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
-    
     # Generate new key if not provided
     if key is None:
         key = generate_chacha20_key()
@@ -569,27 +709,26 @@ def chacha20_encrypt(
     # Generate random 96-bit nonce (12 bytes)
     nonce = os.urandom(12)
     
-    # Create ChaCha20Poly1305 cipher
-    cipher = ChaCha20Poly1305(key)
+    # Get ChaCha20Poly1305 cipher
+    cipher = _chacha20poly1305(bytes(key))
     
     # Encrypt (returns ciphertext + tag combined)
     plaintext_bytes = plaintext.encode('utf-8')
     ciphertext_and_tag = cipher.encrypt(nonce, plaintext_bytes, None)
     
-    # Separate ciphertext and tag (tag is last 16 bytes)
-    ciphertext = ciphertext_and_tag[:-16]
-    tag = ciphertext_and_tag[-16:]
+    # Separate ciphertext and tag (tag is last 16 bytes) without copying
+    ciphertext, tag = _split_tag(ciphertext_and_tag)
     
     # Build result dictionary
     result = {
-        "ciphertext": base64.b64encode(ciphertext).decode('utf-8'),
-        "nonce": base64.b64encode(nonce).decode('utf-8'),
-        "tag": base64.b64encode(tag).decode('utf-8'),
+        "ciphertext": pybase64.b64encode_as_string(ciphertext),
+        "nonce": pybase64.b64encode_as_string(nonce),
+        "tag": pybase64.b64encode_as_string(tag),
         "algorithm": "ChaCha20-Poly1305",
     }
     
     if include_key:
-        result["key"] = base64.b64encode(key).decode('utf-8')
+        result["key"] = pybase64.b64encode_as_string(key)
     
     return result
 
@@ -615,18 +754,13 @@ def chacha20_decrypt(
     Raises:
         InvalidTag: If authentication fails
     """
-    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+    # Decode from base64 and reconstruct ciphertext + tag
+    # (stored separately, so this is the one unavoidable copy)
+    ciphertext_and_tag = pybase64.b64decode(ciphertext) + pybase64.b64decode(tag)
+    nonce_bytes = pybase64.b64decode(nonce)
     
-    # Decode from base64
-    ciphertext_bytes = base64.b64decode(ciphertext)
-    nonce_bytes = base64.b64decode(nonce)
-    tag_bytes = base64.b64decode(tag)
-    
-    # Reconstruct ciphertext + tag
-    ciphertext_and_tag = ciphertext_bytes + tag_bytes
-    
-    # Create cipher
-    cipher = ChaCha20Poly1305(key)
+    # Get cipher
+    cipher = _chacha20poly1305(bytes(key))
     
     # Decrypt and verify tag
     try:
@@ -654,8 +788,6 @@ def generate_ecc_keypair(curve_name: str = "P-256"):
     Returns:
         tuple: (private_key, public_key)
     """
-    from cryptography.hazmat.primitives.asymmetric import ec
-    
     curve_map = {
         "P-256": ec.SECP256R1(),
         "P-384": ec.SECP384R1(),
@@ -665,7 +797,7 @@ def generate_ecc_keypair(curve_name: str = "P-256"):
     if curve_name not in curve_map:
         raise ValueError(f"Unsupported curve: {curve_name}")
     
-    private_key = ec.generate_private_key(curve_map[curve_name], default_backend())
+    private_key = ec.generate_private_key(curve_map[curve_name])
     public_key = private_key.public_key()
     
     return private_key, public_key
@@ -682,16 +814,11 @@ def ecc_sign_data(data: str, private_key) -> str:
     Returns:
         str: Base64 encoded signature
     """
-    from cryptography.hazmat.primitives.asymmetric import ec
-    
     data_bytes = data.encode('utf-8')
     
-    signature = private_key.sign(
-        data_bytes,
-        ec.ECDSA(hashes.SHA512())
-    )
+    signature = private_key.sign(data_bytes, _ECDSA_SHA512)
     
-    return base64.b64encode(signature).decode('utf-8')
+    return pybase64.b64encode_as_string(signature)
 
 
 def ecc_verify_signature(data: str, signature: str, public_key) -> bool:
@@ -706,16 +833,14 @@ def ecc_verify_signature(data: str, signature: str, public_key) -> bool:
     Returns:
         bool: True if signature is valid
     """
-    from cryptography.hazmat.primitives.asymmetric import ec
-    
     data_bytes = data.encode('utf-8')
-    signature_bytes = base64.b64decode(signature)
+    signature_bytes = pybase64.b64decode(signature)
     
     try:
         public_key.verify(
             signature_bytes,
             data_bytes,
-            ec.ECDSA(hashes.SHA512())
+            _ECDSA_SHA512
         )
         return True
     except InvalidSignature:
@@ -744,7 +869,7 @@ def serialize_ecc_private_key(private_key, password: Optional[bytes] = None) ->
         encryption_algorithm=encryption
     )
     
-    return pem.decode('utf-8')
+    return pem.decode('ascii')
 
 
 def serialize_ecc_public_key(public_key) -> str:
@@ -762,7 +887,149 @@ def serialize_ecc_public_key(public_key) -> str:
         format=serialization.PublicFormat.SubjectPublicKeyInfo
     )
     
-    return pem.decode('utf-8')
+    return pem.decode('ascii')
+
+
+
+# Context string binding ECIES-derived keys to this scheme
+_ECIES_INFO = b"AegisCrypt ECIES AES-256-GCM"
+
+
+def _ecies_derive_key(shared_secret: bytes, ephemeral_point: bytes) -> bytes:
+    """Derive the AES-256 key from an ECDH shared secret with HKDF-SHA256."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=_ECIES_INFO + ephemeral_point,
+    ).derive(shared_secret)
+
+
+def hybrid_encrypt_ecc(plaintext: str, public_key) -> Dict[str, str]:
+    """
+    Hybrid encryption with ECIES: ECDH key agreement instead of RSA key wrap.
+    
+    An ephemeral key pair on the recipient's curve agrees a shared secret
+    with the recipient's public key; the AES key is derived from it with
+    HKDF, so no key is encrypted and no RSA operation is needed.
+    
+    Args:
+        plaintext: Data to encrypt
+        public_key: ECC public key of the recipient
+        
+    Returns:
+        dict: Contains:
+            - encrypted_data: AES encrypted data (base64)
+            - ephemeral_key: Ephemeral public key, uncompressed point (base64)
+            - nonce: AES nonce (base64)
+            - tag: AES authentication tag (base64)
+    """
+    # Step 1: Agree a shared secret with an ephemeral key pair
+    ephemeral_key = ec.generate_private_key(public_key.curve)
+    shared_secret = ephemeral_key.exchange(ec.ECDH(), public_key)
+    ephemeral_point = ephemeral_key.public_key().public_bytes(
+        encoding=serialization.Encoding.X962,
+        format=serialization.PublicFormat.UncompressedPoint
+    )
+    
+    # Step 2: Encrypt data with the derived AES key
+    aes_key = _ecies_derive_key(shared_secret, ephemeral_point)
+    aes_result = aes_encrypt(plaintext, aes_key)
+    
+    return {
+        "encrypted_data": aes_result["ciphertext"],
+        "ephemeral_key": pybase64.b64encode_as_string(ephemeral_point),
+        "nonce": aes_result["nonce"],
+        "tag": aes_result["tag"],
+        "algorithm": "Hybrid-AES-256-GCM-ECIES"
+    }
+
+
+def hybrid_decrypt_ecc(
+    encrypted_data: str,
+    ephemeral_key: str,
+    nonce: str,
+    tag: str,
+    private_key
+) -> str:
+    """
+    Decrypt ECIES hybrid encrypted data.
+    
+    Args:
+        encrypted_data: AES encrypted data (base64)
+        ephemeral_key: Ephemeral public key from encryption (base64)
+        nonce: AES nonce (base64)
+        tag: AES authentication tag (base64)
+        private_key: ECC private key of the recipient
+        
+    Returns:
+        str: Decrypted plaintext
+        
+    Raises:
+        ValueError: If the ephemeral key or authentication is invalid
+    """
+    # Step 1: Recompute the shared secret from the ephemeral public key
+    ephemeral_point = pybase64.b64decode(ephemeral_key)
+    ephemeral_public_key = ec.EllipticCurvePublicKey.from_encoded_point(
+        private_key.curve, ephemeral_point
+    )
+    shared_secret = private_key.exchange(ec.ECDH(), ephemeral_public_key)
+    
+    # Step 2: Decrypt the data with the derived AES key
+    aes_key = _ecies_derive_key(shared_secret, ephemeral_point)
+    return aes_decrypt(encrypted_data, aes_key, nonce, tag)
+
+# ============================================================
+# Ed25519 Digital Signatures
+# ============================================================
+
+def generate_ed25519_keypair() -> Tuple[Ed25519PrivateKey, Ed25519PublicKey]:
+    """
+    Generate an Ed25519 key pair.
+    
+    Ed25519 signs much faster than RSA-2048-PSS and verifies faster too,
+    with 32-byte keys and 64-byte signatures; prefer it when signatures
+    are created per request.
+    
+    Returns:
+        tuple: (private_key, public_key)
+    """
+    private_key = Ed25519PrivateKey.generate()
+    return private_key, private_key.public_key()
+
+
+def sign_data_ed25519(data: str, private_key: Ed25519PrivateKey) -> str:
+    """
+    Create a digital signature using Ed25519.
+    
+    Args:
+        data: String to sign
+        private_key: Ed25519 private key
+        
+    Returns:
+        str: Base64 encoded signature
+    """
+    signature = private_key.sign(data.encode('utf-8'))
+    return pybase64.b64encode_as_string(signature)
+
+
+def verify_signature_ed25519(data: str, signature: str, public_key: Ed25519PublicKey) -> bool:
+    """
+    Verify an Ed25519 signature.
+    
+    Args:
+        data: Original data that was signed
+        signature: Base64 encoded signature
+        public_key: Ed25519 public key
+        
+    Returns:
+        bool: True if signature is valid
+    """
+    try:
+        public_key.verify(pybase64.b64decode(signature), data.encode('utf-8'))
+        return True
+    except InvalidSignature:
+        return False
 
 
 # ============================================================
@@ -783,11 +1050,7 @@ def sha3_256_hash(data: str) -> str:
     Returns:
         str: Hexadecimal hash digest
     """
-    from cryptography.hazmat.primitives.hashes import Hash, SHA3_256
-    
-    digest = Hash(SHA3_256(), backend=default_backend())
-    digest.update(data.encode('utf-8'))
-    return digest.finalize().hex()
+    return hashlib.sha3_256(data.encode('utf-8')).hexdigest()
 
 
 def sha3_512_hash(data: str) -> str:
@@ -802,11 +1065,10 @@ def sha3_512_hash(data: str) -> str:
     Returns:
         str: Hexadecimal hash digest
     """
-    from cryptography.hazmat.primitives.hashes import Hash, SHA3_512
-    
-    digest = Hash(SHA3_512(), backend=default_backend())
-    digest.update(data.encode('utf-8'))
-    return digest.finalize().hex()
+    return hashlib.sha3_512(data.encode('utf-8')).hexdigest()
+
+
+_SHA3_HASH_FUNCTIONS = {"SHA3-256": hashlib.sha3_256, "SHA3-512": hashlib.sha3_512}
 
 
 def verify_hash_sha3(data: str, hash_value: str, algorithm: str = "SHA3-256") -> bool:
@@ -824,15 +1086,11 @@ def verify_hash_sha3(data: str, hash_value: str, algorithm: str = "SHA3-256") ->
     Raises:
         ValueError: If algorithm is unsupported
     """
-    if algorithm.upper() == "SHA3-256":
-        computed_hash = sha3_256_hash(data)
-    elif algorithm.upper() == "SHA3-512":
-        computed_hash = sha3_512_hash(data)
-    else:
+    hash_function = _SHA3_HASH_FUNCTIONS.get(algorithm.upper())
+    if hash_function is None:
         raise ValueError(f"Unsupported SHA-3 algorithm: {algorithm}")
     
-    # Constant-time comparison
-    return computed_hash == hash_value
+    return _verify_digest(data, hash_value, hash_function)
 
 
 # ============================================================
@@ -850,6 +1108,7 @@ Asymmetric Encryption:
 - RSA-2048 (standard, widely compatible)
 - ECC P-256 (equivalent to RSA-3072, smaller keys)
 - ECC P-384 (equivalent to RSA-7680, high security)
+- ECIES (ECDH + HKDF-SHA256 + AES-256-GCM, hybrid without RSA)
 
 Hashing:
 - SHA-256 (standard, 256-bit)
@@ -860,6 +1119,7 @@ Hashing:
 Digital Signatures:
 - RSA-PSS with SHA-512 (standard)
 - ECDSA with SHA-512 (smaller signatures, ECC-based)
+- Ed25519 (fastest signing, 64-byte signatures)
 
 All algorithms use industry best practices and are NIST-approved.
 """
@@ -6,14 +6,34 @@ Uses HS256 algorithm with configurable expiration times.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import hashlib
+import threading
+import time
 import jwt
+from jwt.utils import base64url_encode
 from fastapi import HTTPException, status
 
 from app.config import settings
 from app.models.user import UserRole
 
 
+# Decoded access tokens: sha256(token) -> (cache expiry, payload)
+_decoded_tokens: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+_decoded_tokens_lock = threading.Lock()
+_DECODED_TOKENS_MAX = 50000
+
+# Accepted signing algorithms (built once, not per decode)
+_ALGORITHMS = [settings.ALGORITHM]
+
+# Signing key with its algorithm resolved and the HMAC secret prepared once,
+# instead of on every encode/decode
+_SIGNING_KEY = jwt.PyJWK(
+    {"kty": "oct", "k": base64url_encode(settings.SECRET_KEY.encode('utf-8')).decode('ascii')},
+    algorithm=settings.ALGORITHM,
+)
+
+
 def create_access_token(
     user_id: int,
     username: str,
@@ -35,20 +55,21 @@ def create_access_token(
     if expires_delta is None:
         expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    expire = datetime.utcnow() + expires_delta
+    # Epoch seconds, as PyJWT would otherwise convert datetimes to
+    issued_at = int(time.time())
     
     payload = {
         "user_id": user_id,
         "username": username,
         "role": role.value,
         "token_type": "access",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": issued_at + int(expires_delta.total_seconds()),
+        "iat": issued_at,
     }
     
     encoded_jwt = jwt.encode(
         payload,
-        settings.SECRET_KEY,
+        _SIGNING_KEY,
         algorithm=settings.ALGORITHM
     )
     
@@ -76,19 +97,19 @@ def create_refresh_token(
     if expires_delta is None:
         expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     
-    expire = datetime.utcnow() + expires_delta
+    issued_at = int(time.time())
     
     payload = {
         "user_id": user_id,
         "username": username,
         "token_type": "refresh",
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": issued_at + int(expires_delta.total_seconds()),
+        "iat": issued_at,
     }
     
     encoded_jwt = jwt.encode(
         payload,
-        settings.SECRET_KEY,
+        _SIGNING_KEY,
         algorithm=settings.ALGORITHM
     )
     
@@ -111,8 +132,8 @@ def decode_token(token: str) -> Dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+            _SIGNING_KEY,
+            algorithms=_ALGORITHMS
         )
         return payload
     except jwt.ExpiredSignatureError:
@@ -129,6 +150,52 @@ def decode_token(token: str) -> Dict[str, Any]:
         )
 
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and validate an access token, caching the verified payload.
+    
+    Repeat requests with the same token skip signature verification for
+    up to TOKEN_CACHE_TTL_SECONDS, never past the token's own expiry.
+    
+    Args:
+        token: JWT access token string
+        
+    Returns:
+        dict: Decoded token payload
+        
+    Raises:
+        HTTPException: If token is invalid, expired or not an access token
+    """
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        payload = decode_token(token)
+        verify_token_type(payload, "access")
+        return payload
+    
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    
+    with _decoded_tokens_lock:
+        entry = _decoded_tokens.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    payload = decode_token(token)
+    verify_token_type(payload, "access")
+    
+    expires_at = min(now + ttl, payload.get("exp", now))
+    with _decoded_tokens_lock:
+        if len(_decoded_tokens) >= _DECODED_TOKENS_MAX:
+            # Drop expired entries; start over if the cache is still full
+            for stale in [k for k, (exp, _) in _decoded_tokens.items() if exp <= now]:
+                del _decoded_tokens[stale]
+            if len(_decoded_tokens) >= _DECODED_TOKENS_MAX:
+                _decoded_tokens.clear()
+        _decoded_tokens[key] = (expires_at, payload)
+    
+    return payload
+
+
 def verify_token_type(payload: Dict[str, Any], expected_type: str) -> None:
     """
     Verify that the token is of the expected type.
@@ -8,6 +8,8 @@ Author: AI-Driven Adaptive Cryptographic Policy Engine
 Created: 2025-12-13
 """
 
+from functools import lru_cache
+
 # ============================================================================
 # RATE LIMIT CONFIGURATIONS
 # ============================================================================
@@ -53,9 +55,15 @@ DEFAULT_LIMIT = "60/minute"        # 60 requests per minute
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Distinct paths remembered by get_limit_for_endpoint (the app has about
+# fifty routes; paths carrying tokens or IDs just cycle through the rest)
+_ENDPOINT_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=_ENDPOINT_CACHE_SIZE)
 def get_limit_for_endpoint(endpoint: str) -> str:
     """
-    Get rate limit for a specific endpoint.
+    Get rate limit for a specific endpoint (memoized per path).
     
     Args:
         endpoint: API endpoint path
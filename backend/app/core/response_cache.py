@@ -0,0 +1,77 @@
+"""
+Response Cache
+
+Short-lived in-process cache for expensive read-only endpoint results
+(dashboard statistics, security alerts). Keys are tuples whose first element
+is the endpoint path, so all variants of an endpoint can be dropped at once
+when the underlying data is modified.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Tuple
+import threading
+import time
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache for computed endpoint responses.
+
+    Cached values are shared between requests, so only store plain data or
+    Pydantic models - never ORM instances bound to a session.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self.lock = threading.Lock()
+
+    def get_or_set(
+        self,
+        key: Tuple[Hashable, ...],
+        ttl_seconds: int,
+        compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Return the cached value for a key, computing it on miss or expiry.
+
+        Args:
+            key: Cache key, first element is the endpoint path
+            ttl_seconds: Lifetime of a freshly computed value
+            compute: Callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = compute()
+
+        with self.lock:
+            self._entries[key] = (now + ttl_seconds, value)
+
+        return value
+
+    def invalidate(self, *paths: str) -> None:
+        """
+        Drop all cached variants of the given endpoint paths.
+
+        Args:
+            paths: Endpoint paths (e.g. "/admin/stats")
+        """
+        with self.lock:
+            for key in [key for key in self._entries if key[0] in paths]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self.lock:
+            self._entries.clear()
+
+
+# Global instance
+response_cache = ResponseCache()
@@ -5,38 +5,130 @@ Password hashing, verification, and risk scoring for adaptive security.
 """
 
 import bcrypt
+import hashlib
+import os
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
+import secrets
+import threading
+from functools import lru_cache
 from datetime import datetime, time
-from typing import Optional
+from time import monotonic
+from typing import Dict, Optional
 
 from app.config import settings
 from app.models.user import UserRole
 
 
+def _default_kdf_concurrency() -> int:
+    """One concurrent hash per group of ARGON2_PARALLELISM cores."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.ARGON2_PARALLELISM))
+
+
+# Password hashing is CPU-bound. Route handlers call it from worker threads
+# (never the event loop), and both argon2-cffi and bcrypt release the GIL
+# while hashing, so hashes already run in parallel across cores. This caps
+# how many run at once so a login burst does not oversubscribe the CPU.
+_kdf_slots = threading.BoundedSemaphore(settings.KDF_MAX_CONCURRENCY or _default_kdf_concurrency())
+
+
+# Recently verified (hash, password) pairs: keyed digest -> expiry (monotonic)
+_verified_cache: Dict[bytes, float] = {}
+_verified_cache_lock = threading.Lock()
+_verified_cache_secret = secrets.token_bytes(32)
+_VERIFIED_CACHE_MAX = 4096
+
+# Argon2id hasher for new password hashes (bcrypt hashes are still accepted)
+_password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
+
+# Well-formed legacy bcrypt hashes: "$2b$" + cost + "$" + 53 salt/hash chars
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_HASH_LENGTH = 60
+
+
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
     
-    Bcrypt automatically handles salt generation and is resistant
-    to rainbow table attacks.
+    Argon2id is memory-hard (resistant to GPU/ASIC cracking) and embeds
+    its salt and cost parameters in the encoded hash.
     
     Args:
         password: Plain text password
         
     Returns:
-        str: Hashed password (includes salt)
+        str: Hashed password (includes salt and parameters)
     """
-    # Generate salt and hash password
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    with _kdf_slots:
+        return _password_hasher.hash(password)
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    """Keyed digest of a (hash, password) pair; the plaintext is never stored."""
+    return hashlib.blake2b(
+        f"{hashed_password}:{plain_password}".encode('utf-8'),
+        key=_verified_cache_secret,
+        digest_size=16,
+    ).digest()
+
+
+def _remember_verified(key: bytes) -> None:
+    """Record a successful verification for PASSWORD_VERIFY_CACHE_TTL_SECONDS."""
+    now = monotonic()
+    with _verified_cache_lock:
+        if len(_verified_cache) >= _VERIFIED_CACHE_MAX:
+            for stale in [k for k, expires_at in _verified_cache.items() if expires_at <= now]:
+                del _verified_cache[stale]
+            if len(_verified_cache) >= _VERIFIED_CACHE_MAX:
+                _verified_cache.clear()
+        _verified_cache[key] = now + settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS
+
+
+def _verify_bcrypt(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a legacy bcrypt hash.
+    
+    Malformed hashes (wrong length or prefix, or rejected by bcrypt) fail
+    after the same KDF work as a real check, via the dummy Argon2 hash,
+    instead of raising or returning early.
+    """
+    password_bytes = plain_password.encode('utf-8')
+    if (
+        len(hashed_password) == _BCRYPT_HASH_LENGTH
+        and hashed_password.startswith(_BCRYPT_PREFIXES)
+        and hashed_password.isascii()
+    ):
+        try:
+            with _kdf_slots:
+                return bcrypt.checkpw(password_bytes, hashed_password.encode('ascii'))
+        except ValueError:
+            pass
     
-    return hashed.decode('utf-8')
+    dummy_hash = dummy_password_hash()
+    try:
+        with _kdf_slots:
+            _password_hasher.verify(dummy_hash, plain_password)
+    except VerificationError:
+        pass
+    return False
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
+    Supports Argon2id hashes and legacy bcrypt hashes ($2a$/$2b$/$2y$);
+    malformed bcrypt hashes never match.
+    Successful verifications are remembered for a few seconds so repeat
+    logins skip the KDF; the cache key includes the stored hash, so a
+    password change invalidates it. Failures are never cached.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password from database
@@ -44,10 +136,78 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches
     """
-    password_bytes = plain_password.encode('utf-8')
-    hashed_bytes = hashed_password.encode('utf-8')
+    use_cache = settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS > 0
+    if use_cache:
+        key = _verify_cache_key(plain_password, hashed_password)
+        with _verified_cache_lock:
+            expires_at = _verified_cache.get(key)
+        if expires_at is not None and expires_at > monotonic():
+            return True
     
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    if hashed_password.startswith("$2"):
+        valid = _verify_bcrypt(plain_password, hashed_password)
+    else:
+        try:
+            with _kdf_slots:
+                valid = _password_hasher.verify(hashed_password, plain_password)
+        except (VerifyMismatchError, VerificationError, InvalidHashError):
+            valid = False
+    
+    if valid and use_cache:
+        _remember_verified(key)
+    return valid
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be upgraded.
+    
+    True for legacy bcrypt hashes and for Argon2 hashes created with
+    different cost parameters than the current settings.
+    
+    Args:
+        hashed_password: Hashed password from database
+        
+    Returns:
+        bool: True if the password should be re-hashed on next login
+    """
+    if hashed_password.startswith("$2"):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    """
+    Hash of a random throwaway password, computed once on first use.
+    
+    Verifying against it when a username is unknown makes failed logins
+    cost the same KDF work whether or not the account exists.
+    
+    Returns:
+        str: Argon2id hash with the configured cost parameters
+    """
+    return hash_password(secrets.token_urlsafe(16))
+
+
+# Risk score weights, built once at import
+_ROLE_RISK_SCORES = {
+    UserRole.ADMIN: 10,
+    UserRole.MANAGER: 20,
+    UserRole.USER: 30,
+    UserRole.GUEST: 50,
+}
+_SENSITIVITY_RISK_SCORES = {
+    "public": 0,
+    "internal": 0,
+    "confidential": 20,
+    "highly_sensitive": 40,
+}
+_BUSINESS_START = time(settings.BUSINESS_START_HOUR, 0)
+_BUSINESS_END = time(settings.BUSINESS_END_HOUR, 0)
 
 
 def calculate_risk_score(
@@ -82,23 +242,11 @@ def calculate_risk_score(
     score = 0
     
     # Base score by role
-    role_scores = {
-        UserRole.ADMIN: 10,
-        UserRole.MANAGER: 20,
-        UserRole.USER: 30,
-        UserRole.GUEST: 50,
-    }
-    score += role_scores.get(user_role, 30)
+    score += _ROLE_RISK_SCORES.get(user_role, 30)
     
     # Data sensitivity
     if sensitivity_level:
-        sensitivity_scores = {
-            "public": 0,
-            "internal": 0,
-            "confidential": 20,
-            "highly_sensitive": 40,
-        }
-        score += sensitivity_scores.get(sensitivity_level.lower(), 0)
+        score += _SENSITIVITY_RISK_SCORES.get(sensitivity_level.lower(), 0)
     
     # New IP address
     if is_new_ip:
@@ -109,11 +257,9 @@ def calculate_risk_score(
     
     # Off-hours access (outside 9 AM - 6 PM)
     if request_time:
-        business_start = time(settings.BUSINESS_START_HOUR, 0)
-        business_end = time(settings.BUSINESS_END_HOUR, 0)
         current_time = request_time.time()
         
-        if not (business_start <= current_time <= business_end):
+        if not (_BUSINESS_START <= current_time <= _BUSINESS_END):
             score += 15
         
         # Weekend access
@@ -0,0 +1,109 @@
+"""
+Authenticated User Cache
+
+Caches the user row resolved from an access token so that authenticated
+requests don't need a SELECT on the users table every time.
+
+Cached rows are re-attached to the request's session as detached instances,
+so route handlers receive a regular User object they can modify and commit.
+Entries must be invalidated whenever the user row changes.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models.user import User
+
+
+class UserCache:
+    """
+    Thread-safe in-process TTL cache of user rows keyed by user ID.
+
+    Stores plain column values (not ORM instances) so cached data is never
+    shared between sessions or threads.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached entry
+            max_entries: Maximum number of cached users (oldest evicted first)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._columns = tuple(column.key for column in User.__table__.columns)
+        self.lock = threading.Lock()
+
+    def get(self, user_id: int, db: Session) -> Optional[User]:
+        """
+        Get a cached user attached to the given session.
+
+        Args:
+            user_id: User ID from the token payload
+            db: Request database session
+
+        Returns:
+            User: Session-bound user, or None on cache miss
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        with self.lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+
+        # Already loaded in this session (identity map) - reuse it
+        existing = db.identity_map.get(db.identity_key(User, user_id))
+        if existing is not None:
+            return existing
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    def set(self, user: User) -> None:
+        """
+        Cache the column values of a freshly loaded user.
+
+        Args:
+            user: Persistent user loaded from the database
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        values = {key: getattr(user, key) for key in self._columns}
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self.lock:
+            self._entries[user.id] = (expires_at, values)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop the cached entry for a user after the row was modified."""
+        with self.lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self.lock:
+            self._entries.clear()
+
+
+# Global instance
+user_cache = UserCache(ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
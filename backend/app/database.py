@@ -5,6 +5,9 @@ This module sets up the SQLAlchemy engine, session factory,
 and provides the base class for all database models.
 """
 
+import os
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
@@ -13,11 +16,38 @@ from typing import Generator
 from app.config import settings
 
 
+def _pool_options() -> dict:
+    """
+    Connection pool sizing for the engine.
+    
+    Sync route handlers run in a thread pool, so the pool must hold enough
+    connections for concurrent requests instead of SQLAlchemy's 5+10 default.
+    In-memory SQLite uses a single-connection pool and takes no sizing.
+    """
+    if settings.DATABASE_URL.startswith("sqlite") and ":memory:" in settings.DATABASE_URL:
+        return {}
+    
+    pool_size = settings.DB_POOL_SIZE or min((os.cpu_count() or 1) * 4, 40)
+    max_overflow = settings.DB_MAX_OVERFLOW if settings.DB_MAX_OVERFLOW >= 0 else 2 * pool_size
+    
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,  # Validate connections on checkout
+    }
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    **_pool_options(),
+    # JSON columns (e.g. MFA backup codes) are encoded/decoded with orjson
+    json_serializer=lambda obj: orjson.dumps(obj).decode('utf-8'),
+    json_deserializer=orjson.loads,
 )
 
 # Create SessionLocal class for database sessions
@@ -6,13 +6,20 @@ Entry point for the Adaptive Cryptographic Policy Engine API.
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
+import anyio.to_thread
+import os
 import time
 
 from app.config import settings
 from app.database import init_db
+from app.core.security import dummy_password_hash
+from app.services.audit_queue import audit_queue
+from app.services.encryption_service import get_service_keypair
+from app.services.ml_classifier import get_classifier
+from app.services.explainability_service import get_explainer
 from app.utils.logger import logger, log_request
 from app.api.v1 import auth, classification, encryption, policies, analytics, admin, export, public, benchmarks
 from app.middleware.security_headers import SecurityHeadersMiddleware
@@ -28,6 +35,7 @@ app = FastAPI(
     description="AI-Driven Adaptive Cryptographic Policy Engine for Context-Aware Data Protection",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Initialize rate limiter
@@ -99,6 +107,11 @@ async def startup_event():
     Initialize application on startup.
     
     - Creates database tables
+    - Precomputes the dummy login hash
+    - Starts the audit log writer
+    - Builds the shared classifier services
+    - Generates the service RSA keypair
+    - Sizes the threadpool for sync endpoints
     - Logs startup message
     """
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
@@ -111,12 +124,37 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise
+    
+    # Precompute the dummy hash used for unknown-username logins; its time
+    # is the KDF cost every login pays with the configured Argon2 settings
+    started = time.perf_counter()
+    dummy_password_hash()
+    logger.info("Password hash cost: %.0f ms per hash", (time.perf_counter() - started) * 1000)
+    
+    # Start writing queued audit log entries in batches
+    audit_queue.start()
+    
+    # Build shared classifier services before the first request needs them
+    get_classifier()
+    get_explainer()
+    
+    # Generate the service keypair before concurrent requests race for it
+    get_service_keypair()
+    
+    # Sync endpoints (encryption, classification, DB access) share this pool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.THREADPOOL_SIZE or max(40, 4 * (os.cpu_count() or 1))
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up on shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    benchmarks.shutdown_benchmark_executor()
+    
+    # Write any audit log entries still queued
+    audit_queue.stop()
 
 
 # Root endpoint
@@ -164,10 +202,20 @@ app.include_router(benchmarks.router, prefix="/api/v1")  # Public endpoints
 
 # Run with: uvicorn app.main:app --reload
 if __name__ == "__main__":
+    import sys
     import uvicorn
+    
+    run_options = {}
+    if sys.platform != "win32":
+        # uvloop event loop and httptools parser ship with uvicorn[standard]
+        run_options.update(loop="uvloop", http="httptools")
+    
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        workers=None if settings.DEBUG else settings.WORKERS,
+        access_log=False,  # log_requests middleware already logs every request
+        **run_options,
     )
@@ -8,10 +8,14 @@ Author: AI-Driven Adaptive Cryptographic Policy Engine
 Created: 2025-12-13
 """
 
-from typing import Dict, Optional
+from typing import Deque, Dict, Optional
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
+import time
+
+# Failed logins older than this no longer count towards blocking
+_FAILED_ATTEMPT_WINDOW_SECONDS = 300
 
 # ============================================================================
 # ADAPTIVE RATE LIMITER
@@ -31,8 +35,8 @@ class AdaptiveRateLimiter:
     
     def __init__(self):
         """Initialize the adaptive rate limiter."""
-        # Track failed login attempts per email
-        self.failed_attempts: Dict[str, list] = defaultdict(list)
+        # Timestamps (time.monotonic, oldest first) of failed login attempts per email
+        self.failed_attempts: Dict[str, Deque[float]] = defaultdict(deque)
         
         # Track suspicious IPs
         self.suspicious_ips: Dict[str, dict] = defaultdict(dict)
@@ -89,19 +93,17 @@ class AdaptiveRateLimiter:
             
             if not success:
                 # Failed login attempt
-                self.failed_attempts[email].append({
-                    'timestamp': now,
-                    'ip': ip_address
-                })
+                attempts = self.failed_attempts[email]
+                now_ts = time.monotonic()
+                attempts.append(now_ts)
                 
-                # Clean old attempts (older than 5 minutes)
-                self.failed_attempts[email] = [
-                    attempt for attempt in self.failed_attempts[email]
-                    if now - attempt['timestamp'] < timedelta(minutes=5)
-                ]
+                # Drop old attempts (older than 5 minutes) from the front
+                cutoff = now_ts - _FAILED_ATTEMPT_WINDOW_SECONDS
+                while attempts[0] <= cutoff:
+                    attempts.popleft()
                 
                 # Count recent failures
-                recent_failures = len(self.failed_attempts[email])
+                recent_failures = len(attempts)
                 
                 # Adaptive blocking based on failure count
                 if recent_failures >= 10:
@@ -10,6 +10,7 @@ from app.models.data_classification import DataItem
 from app.models.encryption_policy import EncryptionPolicy
 from app.models.audit_log import AuditLog
 from app.models.share_link import ShareLink
+from app.models.benchmark_run import BenchmarkRun
 
 __all__ = [
     "User",
@@ -17,5 +18,6 @@ __all__ = [
     "EncryptionPolicy",
     "AuditLog",
     "ShareLink",
+    "BenchmarkRun",
 ]
 
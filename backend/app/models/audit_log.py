@@ -6,13 +6,31 @@ Comprehensive logging of all security-relevant actions in the system.
 Tracks user activities, risk scores, MFA enforcement, and access patterns.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
 
 
+# Risk score from which an action counts as high risk
+HIGH_RISK_SCORE = 61
+
+# Actions that are always reported as security events
+SECURITY_ACTIONS = frozenset({
+    "login",
+    "login_failed",
+    "logout",
+    "mfa_required",
+    "mfa_failed",
+    "access_denied",
+    "policy_changed",
+    "user_created",
+    "user_deleted",
+    "role_changed",
+})
+
+
 class AuditLog(Base):
     """
     Audit log model for comprehensive security logging.
@@ -49,6 +67,10 @@ class AuditLog(Base):
     """
     
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Time-windowed counts filtered by action (analytics, admin stats)
+        Index("ix_audit_logs_timestamp_action", "timestamp", "action"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -155,9 +177,9 @@ class AuditLog(Base):
         comment="When the action occurred"
     )
     
-    # Relationships
-    user = relationship("User", back_populates="audit_logs")
-    data_item = relationship("DataItem", back_populates="audit_logs")
+    # Relationships (lazy loads raise - use selectinload/joinedload explicitly)
+    user = relationship("User", back_populates="audit_logs", lazy="raise_on_sql")
+    data_item = relationship("DataItem", back_populates="audit_logs", lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return (
@@ -170,22 +192,10 @@ class AuditLog(Base):
     @property
     def is_high_risk(self) -> bool:
         """Check if this action was high risk."""
-        return self.risk_score is not None and self.risk_score >= 61
+        return self.risk_score is not None and self.risk_score >= HIGH_RISK_SCORE
     
     @property
     def is_security_event(self) -> bool:
         """Check if this is a security-relevant event."""
-        security_actions = [
-            "login",
-            "login_failed",
-            "logout",
-            "mfa_required",
-            "mfa_failed",
-            "access_denied",
-            "policy_changed",
-            "user_created",
-            "user_deleted",
-            "role_changed",
-        ]
-        return self.action in security_actions or not self.success
+        return self.action in SECURITY_ACTIONS or not self.success
 
@@ -0,0 +1,45 @@
+"""
+Benchmark Run Model
+
+Stores benchmark suite reports so results are shared by every API worker
+process and survive restarts.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, JSON
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class BenchmarkRun(Base):
+    """
+    A stored benchmark report.
+
+    Attributes:
+        id: Primary key (increases with each run)
+        report: Full report (timestamp, results, summary) as JSON
+        created_at: When the report was stored
+    """
+
+    __tablename__ = "benchmark_runs"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Report
+    report = Column(
+        JSON,
+        nullable=False,
+        comment="Benchmark report: timestamp, results and summary"
+    )
+
+    # Timestamps
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        comment="When the report was stored"
+    )
+
+    def __repr__(self) -> str:
+        return f"<BenchmarkRun(id={self.id}, created_at={self.created_at})>"
@@ -6,7 +6,7 @@ Stores classified and encrypted data items with their sensitivity levels,
 encryption metadata, and cryptographic operations applied.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -61,6 +61,10 @@ class DataItem(Base):
     """
     
     __tablename__ = "data_items"
+    __table_args__ = (
+        # A user's items by ID (data listing keyset pagination)
+        Index("ix_data_items_user_id_id", "user_id", "id"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -162,12 +166,13 @@ class DataItem(Base):
         comment="Last update timestamp"
     )
     
-    # Relationships
-    user = relationship("User", back_populates="data_items")
+    # Relationships (lazy loads raise - use selectinload/joinedload explicitly)
+    user = relationship("User", back_populates="data_items", lazy="raise_on_sql")
     audit_logs = relationship(
         "AuditLog",
         back_populates="data_item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql"
     )
     
     def __repr__(self) -> str:
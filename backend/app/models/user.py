@@ -6,7 +6,8 @@ Defines the User database model for authentication and authorization.
 Includes role-based access control (RBAC) with four-tier role system.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -31,6 +32,23 @@ class UserRole(str, enum.Enum):
     GUEST = "guest"
 
 
+# Role hierarchy level (higher = more privileges)
+ROLE_LEVEL = {
+    UserRole.GUEST: 1,
+    UserRole.USER: 2,
+    UserRole.MANAGER: 3,
+    UserRole.ADMIN: 4,
+}
+
+# Sensitivity levels each role may access
+ROLE_SENSITIVITY_ACCESS = {
+    UserRole.ADMIN: frozenset({"public", "internal", "confidential", "highly_sensitive"}),
+    UserRole.MANAGER: frozenset({"public", "internal", "confidential"}),
+    UserRole.USER: frozenset({"public", "internal"}),
+    UserRole.GUEST: frozenset({"public"}),
+}
+
+
 class User(Base):
     """
     User model for authentication and authorization.
@@ -39,7 +57,7 @@ class User(Base):
         id: Primary key
         username: Unique username for login
         email: Unique email address
-        password_hash: Bcrypt hashed password (never store plaintext!)
+        password_hash: Argon2id (or legacy bcrypt) hashed password (never store plaintext!)
         role: User role for RBAC (admin, manager, user, guest)
         is_active: Whether the user account is active
         mfa_enabled: Whether MFA is enabled for this user
@@ -55,6 +73,21 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Covers the login lookup so PostgreSQL can answer it with an
+        # index-only scan (other databases use the unique username index)
+        Index(
+            "ix_users_username_login",
+            "username",
+            postgresql_include=[
+                "id",
+                "password_hash",
+                "role",
+                "is_active",
+                "failed_login_attempts",
+            ],
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -77,7 +110,7 @@ class User(Base):
     password_hash = Column(
         String(255),
         nullable=False,
-        comment="Bcrypt hashed password"
+        comment="Argon2id (or legacy bcrypt) hashed password"
     )
     
     # Authorization
@@ -109,9 +142,9 @@ class User(Base):
         comment="TOTP secret for MFA (encrypted)"
     )
     backup_codes = Column(
-        String(1000),
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=True,
-        comment="JSON array of backup codes for MFA recovery"
+        comment="JSON array of hashed backup codes for MFA recovery"
     )
     
     # Timestamps
@@ -140,16 +173,18 @@ class User(Base):
         comment="Timestamp of last failed login"
     )
     
-    # Relationships
+    # Relationships (lazy loads raise - use selectinload/joinedload explicitly)
     data_items = relationship(
         "DataItem",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql"
     )
     audit_logs = relationship(
         "AuditLog",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql"
     )
     
     def __repr__(self) -> str:
@@ -168,14 +203,7 @@ class User(Base):
         Returns:
             bool: True if user has sufficient permissions
         """
-        role_hierarchy = {
-            UserRole.GUEST: 1,
-            UserRole.USER: 2,
-            UserRole.MANAGER: 3,
-            UserRole.ADMIN: 4,
-        }
-        
-        return role_hierarchy.get(self.role, 0) >= role_hierarchy.get(required_role, 0)
+        return ROLE_LEVEL.get(self.role, 0) >= ROLE_LEVEL.get(required_role, 0)
     
     def can_access_sensitivity(self, sensitivity_level: str) -> bool:
         """
@@ -193,13 +221,5 @@ class User(Base):
         Returns:
             bool: True if user can access this sensitivity level
         """
-        access_matrix = {
-            UserRole.ADMIN: ["public", "internal", "confidential", "highly_sensitive"],
-            UserRole.MANAGER: ["public", "internal", "confidential"],
-            UserRole.USER: ["public", "internal"],
-            UserRole.GUEST: ["public"],
-        }
-        
-        allowed_levels = access_matrix.get(self.role, [])
-        return sensitivity_level.lower() in allowed_levels
+        return sensitivity_level.lower() in ROLE_SENSITIVITY_ACCESS.get(self.role, frozenset())
 
@@ -0,0 +1,208 @@
+"""
+Audit Log Queue
+
+Buffers audit log entries in memory and writes them in batches from a
+background thread, so request handlers don't wait on an INSERT + COMMIT.
+
+Entries are flushed when a batch is full or AUDIT_FLUSH_INTERVAL_MS has
+passed, and on application shutdown.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.audit_log import AuditLog, HIGH_RISK_SCORE, SECURITY_ACTIONS
+from app.utils.logger import logger, log_security_event
+
+
+# Column defaults for queued entries (executemany needs uniform rows)
+_ROW_DEFAULTS: Dict[str, Any] = {
+    "user_id": None,
+    "data_id": None,
+    "risk_score": None,
+    "mfa_required": False,
+    "mfa_completed": False,
+    "ip_address": None,
+    "user_agent": None,
+    "request_path": None,
+    "request_method": None,
+    "status_code": None,
+    "success": True,
+    "failure_reason": None,
+    "additional_data": None,
+}
+
+# Tells the writer thread to flush and exit
+_STOP = object()
+
+
+class AuditQueue:
+    """
+    Thread-safe audit log buffer with a single batching writer thread.
+
+    Until start() is called (scripts, tests without app startup) entries
+    are written synchronously.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_ms: int, max_size: int):
+        """
+        Initialize the queue.
+
+        Args:
+            batch_size: Maximum entries written per INSERT
+            flush_interval_ms: Maximum time an entry waits before being written
+            max_size: Queued entries before enqueue() falls back to a direct write
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_size)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write all queued entries and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def enqueue(self, action: str, **kwargs: Any) -> None:
+        """
+        Queue an audit log entry.
+
+        Accepts the same arguments as AuditService.log_action. The entry is
+        timestamped now, not when it is written.
+
+        Args:
+            action: Action type (login, classify, encrypt, etc.)
+            **kwargs: Remaining audit log fields
+        """
+        row = dict(_ROW_DEFAULTS, action=action, timestamp=datetime.utcnow(), **kwargs)
+
+        # Log security events
+        risk_score = row["risk_score"]
+        if (
+            not row["success"]
+            or (risk_score is not None and risk_score >= HIGH_RISK_SCORE)
+            or action in SECURITY_ACTIONS
+        ):
+            log_security_event(
+                event_type=action,
+                user_id=row["user_id"],
+                details=row["failure_reason"],
+                risk_score=risk_score
+            )
+
+        # Direct writes raise on failure, like a request's own INSERT would
+        if self._thread is None:
+            self._insert([row])
+            return
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("Audit queue full - writing entry synchronously")
+            self._insert([row])
+
+    def _run(self) -> None:
+        """Writer loop: collect entries into batches and write them."""
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    # Drain whatever is left before exiting
+                    while True:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            for start in range(0, len(batch), self.batch_size):
+                self._write(batch[start:start + self.batch_size])
+
+    @staticmethod
+    def _insert(rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert audit log rows in one statement and transaction.
+
+        Args:
+            rows: Audit log column values
+
+        Raises:
+            Exception: If the INSERT or COMMIT fails (rolled back)
+        """
+        db = SessionLocal()
+        try:
+            db.execute(insert(AuditLog), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch from the writer thread without losing good rows.
+
+        If the batch INSERT fails (e.g. one row references a deleted user or
+        data item), each row is retried in its own transaction and only the
+        rows that still fail are logged and dropped.
+
+        Args:
+            rows: Audit log column values
+        """
+        if not rows:
+            return
+        try:
+            self._insert(rows)
+            return
+        except Exception as e:
+            if len(rows) > 1:
+                logger.warning(f"Failed to write {len(rows)} audit log entries, retrying one by one: {e}")
+            else:
+                logger.error(f"Dropped audit log entry ({rows[0]['action']}, user {rows[0]['user_id']}): {e}")
+                return
+
+        for row in rows:
+            try:
+                self._insert([row])
+            except Exception as e:
+                logger.error(f"Dropped audit log entry ({row['action']}, user {row['user_id']}): {e}")
+
+
+# Global audit queue
+audit_queue = AuditQueue(
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval_ms=settings.AUDIT_FLUSH_INTERVAL_MS,
+    max_size=settings.AUDIT_QUEUE_MAX_SIZE,
+)
@@ -7,9 +7,9 @@ Handles audit logging and security analytics.
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import select, func, and_
 
-from app.models.audit_log import AuditLog
+from app.models.audit_log import AuditLog, HIGH_RISK_SCORE
 from app.models.user import User
 from app.models.data_classification import DataItem
 from app.utils.logger import logger, log_security_event
@@ -88,12 +88,16 @@ class AuditService:
             additional_data=additional_data,
         )
         
+        # Decide before committing: the committed row is expired and reading
+        # it back would cost another SELECT
+        is_security_event = not success or audit_log.is_high_risk or audit_log.is_security_event
+        
+        # Commits any pending changes from the caller in the same transaction
         self.db.add(audit_log)
         self.db.commit()
-        self.db.refresh(audit_log)
         
         # Log security events
-        if not success or audit_log.is_high_risk or audit_log.is_security_event:
+        if is_security_event:
             log_security_event(
                 event_type=action,
                 user_id=user_id,
@@ -107,23 +111,29 @@ class AuditService:
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        before_id: Optional[int] = None
     ) -> List[AuditLog]:
         """
-        Get audit logs for a specific user.
+        Get audit logs for a specific user, newest first.
         
         Args:
             user_id: User ID
             limit: Maximum number of logs to return
             offset: Offset for pagination
+            before_id: Keyset cursor - only return logs older than this ID
             
         Returns:
             list: Audit log entries
         """
+        query = self.db.query(AuditLog).filter(AuditLog.user_id == user_id)
+        
+        if before_id is not None:
+            query = query.filter(AuditLog.id < before_id)
+        
         return (
-            self.db.query(AuditLog)
-            .filter(AuditLog.user_id == user_id)
-            .order_by(AuditLog.timestamp.desc())
+            query
+            .order_by(AuditLog.id.desc())
             .limit(limit)
             .offset(offset)
             .all()
@@ -133,21 +143,26 @@ class AuditService:
         self,
         limit: int = 100,
         action: Optional[str] = None,
-        success_only: Optional[bool] = None
+        success_only: Optional[bool] = None,
+        before_id: Optional[int] = None
     ) -> List[AuditLog]:
         """
-        Get recent audit logs.
+        Get recent audit logs, newest first.
         
         Args:
             limit: Maximum number of logs
             action: Filter by action type
             success_only: Filter by success status
+            before_id: Keyset cursor - only return logs older than this ID
             
         Returns:
             list: Recent audit log entries
         """
         query = self.db.query(AuditLog)
         
+        if before_id is not None:
+            query = query.filter(AuditLog.id < before_id)
+        
         if action:
             query = query.filter(AuditLog.action == action)
         
@@ -156,30 +171,36 @@ class AuditService:
         
         return (
             query
-            .order_by(AuditLog.timestamp.desc())
+            .order_by(AuditLog.id.desc())
             .limit(limit)
             .all()
         )
     
     def get_high_risk_logs(
         self,
-        threshold: int = 61,
-        limit: int = 50
+        threshold: int = HIGH_RISK_SCORE,
+        limit: int = 50,
+        before_id: Optional[int] = None
     ) -> List[AuditLog]:
         """
-        Get high-risk audit logs.
+        Get high-risk audit logs, newest first.
         
         Args:
             threshold: Minimum risk score to include
             limit: Maximum number of logs
+            before_id: Keyset cursor - only return logs older than this ID
             
         Returns:
             list: High-risk audit log entries
         """
+        query = self.db.query(AuditLog).filter(AuditLog.risk_score >= threshold)
+        
+        if before_id is not None:
+            query = query.filter(AuditLog.id < before_id)
+        
         return (
-            self.db.query(AuditLog)
-            .filter(AuditLog.risk_score >= threshold)
-            .order_by(AuditLog.timestamp.desc())
+            query
+            .order_by(AuditLog.id.desc())
             .limit(limit)
             .all()
         )
@@ -225,83 +246,39 @@ class AuditService:
         """
         since = datetime.utcnow() - timedelta(days=days)
         
-        # Total actions
-        total_actions = self.db.query(func.count(AuditLog.id)).filter(
-            AuditLog.timestamp >= since
-        ).scalar()
-        
-        # Successful vs failed
-        successful = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.success == True
-            )
-        ).scalar()
+        in_window = AuditLog.timestamp >= since
+        
+        # All counters in one aggregate query over the window
+        (
+            total_actions,
+            successful,
+            high_risk,
+            mfa_enforced,
+            unique_users,
+            unique_ips,
+            login_attempts,
+            login_successes,
+            classifications,
+            encryptions,
+            decryptions,
+        ) = self.db.execute(
+            select(
+                func.count(),
+                func.count().filter(AuditLog.success == True),
+                func.count().filter(AuditLog.risk_score >= HIGH_RISK_SCORE),
+                func.count().filter(AuditLog.mfa_required == True),
+                func.count(func.distinct(AuditLog.user_id)),
+                func.count(func.distinct(AuditLog.ip_address)),
+                func.count().filter(AuditLog.action.in_(["login", "login_failed"])),
+                func.count().filter(AuditLog.action == "login"),
+                func.count().filter(AuditLog.action == "classify"),
+                func.count().filter(AuditLog.action == "encrypt"),
+                func.count().filter(AuditLog.action == "decrypt"),
+            ).where(in_window)
+        ).one()
         
         failed = total_actions - successful
         
-        # High risk actions
-        high_risk = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.risk_score >= 61
-            )
-        ).scalar()
-        
-        # MFA enforced
-        mfa_enforced = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.mfa_required == True
-            )
-        ).scalar()
-        
-        # Unique users
-        unique_users = self.db.query(func.count(func.distinct(AuditLog.user_id))).filter(
-            AuditLog.timestamp >= since
-        ).scalar()
-        
-        # Unique IPs
-        unique_ips = self.db.query(func.count(func.distinct(AuditLog.ip_address))).filter(
-            AuditLog.timestamp >= since
-        ).scalar()
-        
-        # Action breakdown
-        login_attempts = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.action.in_(["login", "login_failed"])
-            )
-        ).scalar()
-        
-        login_successes = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.action == "login"
-            )
-        ).scalar()
-        
-        classifications = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.action == "classify"
-            )
-        ).scalar()
-        
-        encryptions = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.action == "encrypt"
-            )
-        ).scalar()
-        
-        decryptions = self.db.query(func.count(AuditLog.id)).filter(
-            and_(
-                AuditLog.timestamp >= since,
-                AuditLog.action == "decrypt"
-            )
-        ).scalar()
-        
         return {
             "total_actions": total_actions or 0,
             "successful_actions": successful or 0,
@@ -336,7 +313,7 @@ class AuditService:
                 AuditLog.timestamp >= since,
                 (
                     (AuditLog.success == False) |
-                    (AuditLog.risk_score >= 61)
+                    (AuditLog.risk_score >= HIGH_RISK_SCORE)
                 )
             )
         ).order_by(AuditLog.timestamp.desc()).limit(limit)
@@ -361,7 +338,7 @@ class AuditService:
         """Format an alert message from audit log."""
         if not log.success:
             return f"Failed {log.action} attempt from {log.ip_address or 'unknown IP'}"
-        elif log.risk_score and log.risk_score >= 61:
+        elif log.risk_score and log.risk_score >= HIGH_RISK_SCORE:
             return f"High-risk {log.action} (score: {log.risk_score}) from {log.ip_address or 'unknown IP'}"
         else:
             return f"Security event: {log.action}"
@@ -0,0 +1,94 @@
+"""
+Classifier Result Cache
+
+Remembers sensitivity classifications of recently seen texts, so repeated
+payloads (retries, the same document encrypted again, dashboard demos)
+skip the classifier entirely.
+
+Texts are keyed by a BLAKE2b digest of the text and the classification
+mode (ML or rule-based); the text itself is never stored.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Tuple
+import hashlib
+import threading
+
+from app.config import settings
+from app.models.data_classification import SensitivityLevel
+
+
+Classification = Tuple[SensitivityLevel, float]
+
+
+class ClassifierCache:
+    """
+    Thread-safe LRU cache of (sensitivity_level, confidence_score) results.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results (least recently used evicted first)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Classification]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str, use_ml: bool) -> bytes:
+        """Digest identifying a text and classification mode."""
+        return hashlib.blake2b(
+            text.encode('utf-8'),
+            digest_size=16,
+            person=b"ml" if use_ml else b"rules",
+        ).digest()
+
+    def get_or_compute(
+        self,
+        text: str,
+        classify: Callable[[str], Classification],
+        use_ml: bool = False
+    ) -> Classification:
+        """
+        Return the cached classification of a text, classifying it on miss.
+
+        Args:
+            text: Text to classify
+            classify: Classifier function (e.g. MLClassifierService.classify)
+            use_ml: Whether classify is the ML classifier (results of the two
+                modes are cached separately)
+
+        Returns:
+            tuple: (sensitivity_level, confidence_score)
+        """
+        if self.max_entries <= 0:
+            return classify(text)
+
+        key = self._key(text, use_ml)
+        with self.lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+
+        result = classify(text)
+
+        with self.lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached results (e.g. after the classifier changes)."""
+        with self.lock:
+            self._entries.clear()
+
+
+# Global instance
+classifier_cache = ClassifierCache(max_entries=settings.CLASSIFIER_CACHE_SIZE)
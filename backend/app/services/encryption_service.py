@@ -5,8 +5,10 @@ Handles all encryption, decryption, hashing, and signing operations
 based on policy engine recommendations.
 """
 
-from typing import Dict, Any, Optional
-import base64
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import pybase64
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, RSAPublicKey
 from sqlalchemy.orm import Session
 
 from app.models.data_classification import DataItem, SensitivityLevel
@@ -29,6 +31,22 @@ from app.services.policy_engine import PolicyEngineService
 from app.utils.logger import logger
 
 
+@lru_cache(maxsize=1)
+def get_service_keypair() -> Tuple[RSAPrivateKey, RSAPublicKey]:
+    """
+    Get the RSA keypair used for hybrid encryption and signatures.
+    
+    Generated once per process on first use (in production, load from
+    secure storage), so requests don't pay for 2048-bit key generation and
+    data encrypted or signed by one request can be decrypted and verified
+    by the next.
+    
+    Returns:
+        tuple: (private_key, public_key)
+    """
+    return generate_rsa_keypair(2048)
+
+
 class EncryptionService:
     """
     Service for encryption, decryption, and cryptographic operations.
@@ -47,8 +65,8 @@ class EncryptionService:
         self.db = db
         self.policy_engine = PolicyEngineService(db)
         
-        # Generate RSA keypair for the service (in production, load from secure storage)
-        self.private_key, self.public_key = generate_rsa_keypair(2048)
+        # RSA keypair shared by all service instances
+        self.private_key, self.public_key = get_service_keypair()
     
     def encrypt_and_store(
         self,
@@ -135,8 +153,8 @@ class EncryptionService:
         self.db.refresh(data_item)
         
         logger.info(
-            f"Encrypted and stored data item {data_item.id} "
-            f"(sensitivity: {sensitivity_level.value}, user: {user.id})"
+            "Encrypted and stored data item %s (sensitivity: %s, user: %s)",
+            data_item.id, sensitivity_level.value, user.id
         )
         
         return data_item
@@ -160,12 +178,12 @@ class EncryptionService:
         if not data_item.encrypted_content:
             raise ValueError("Data item is not encrypted")
         
-        logger.info(f"Attempting to decrypt data item {data_item.id}, algorithm: {data_item.encryption_algorithm}")
+        logger.debug("Attempting to decrypt data item %s, algorithm: %s", data_item.id, data_item.encryption_algorithm)
         
         # Decrypt based on algorithm
         if "Hybrid" in data_item.encryption_algorithm:
             # Hybrid decryption
-            logger.info("Using hybrid decryption")
+            logger.debug("Using hybrid decryption")
             plaintext = hybrid_decrypt(
                 encrypted_data=data_item.encrypted_content,
                 encrypted_key=data_item.encryption_key_id,
@@ -175,11 +193,11 @@ class EncryptionService:
             )
         else:
             # AES decryption
-            logger.info(f"Using AES decryption, key_id length: {len(data_item.encryption_key_id)}")
+            logger.debug("Using AES decryption, key_id length: %d", len(data_item.encryption_key_id))
             # In production, retrieve key from key management service
             try:
-                key = base64.b64decode(data_item.encryption_key_id)
-                logger.info(f"Decoded key length: {len(key)} bytes")
+                key = pybase64.b64decode(data_item.encryption_key_id)
+                logger.debug("Decoded key length: %d bytes", len(key))
             except Exception as e:
                 logger.error(f"Failed to decode encryption key: {e}")
                 raise ValueError(f"Failed to decode encryption key: {e}")
@@ -213,7 +231,7 @@ class EncryptionService:
             if not signature_verified:
                 logger.warning(f"Signature verification failed for data item {data_item.id}")
         
-        logger.info(f"Decrypted data item {data_item.id} (hash_ok: {hash_verified})")
+        logger.info("Decrypted data item %s (hash_ok: %s)", data_item.id, hash_verified)
         
         return {
             "decrypted_text": plaintext,
@@ -6,6 +6,7 @@ Implements pattern detection and feature importance analysis for transparency.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from app.schemas.share import SensitivityLevel
@@ -99,6 +100,13 @@ class ExplainabilityService:
         },
     }
     
+    # Patterns compiled once; each is scanned separately because matches
+    # may overlap (e.g. an SSN inside a phone-number-shaped run of digits)
+    _COMPILED_PATTERNS = {
+        pattern_type: re.compile(pattern_info['regex'], re.IGNORECASE)
+        for pattern_type, pattern_info in PATTERNS.items()
+    }
+    
     # Keyword categories
     KEYWORDS = {
         'medical': {
@@ -142,6 +150,12 @@ class ExplainabilityService:
         },
     }
     
+    # Lowercased keywords per category, matched against the lowercased text
+    _KEYWORD_WORDS = {
+        category: tuple(word.lower() for word in category_info['words'])
+        for category, category_info in KEYWORDS.items()
+    }
+    
     def explain_classification(
         self,
         text: str,
@@ -159,14 +173,28 @@ class ExplainabilityService:
         Returns:
             ExplanationResult with all explanation components
         """
+        # Blank text has no patterns, keywords or regions to report
+        if not text or text.isspace():
+            return ExplanationResult(
+                sensitivity_level=sensitivity_level.value,
+                confidence_score=confidence_score,
+                explanation=self._generate_explanation(sensitivity_level, [], confidence_score),
+                detected_patterns=[],
+                feature_importance=[],
+                highlighted_regions=[]
+            )
+        
+        # Scan the text once per pattern; matches are shared by both steps
+        matches = self._find_matches(text)
+        
         # Detect patterns and keywords
-        detected_patterns = self._detect_patterns(text)
+        detected_patterns = self._detect_patterns(text, matches)
         
         # Calculate feature importance
         feature_importance = self._calculate_feature_importance(detected_patterns)
         
         # Find highlighted regions
-        highlighted_regions = self._find_sensitive_regions(text, detected_patterns)
+        highlighted_regions = self._find_sensitive_regions(matches)
         
         # Generate human-readable explanation
         explanation = self._generate_explanation(
@@ -184,14 +212,24 @@ class ExplainabilityService:
             highlighted_regions=highlighted_regions
         )
     
-    def _detect_patterns(self, text: str) -> List[DetectedPattern]:
+    def _find_matches(self, text: str) -> Dict[str, List[re.Match]]:
+        """Find all matches of each regex pattern in text."""
+        return {
+            pattern_type: list(pattern.finditer(text))
+            for pattern_type, pattern in self._COMPILED_PATTERNS.items()
+        }
+    
+    def _detect_patterns(
+        self,
+        text: str,
+        matches: Dict[str, List[re.Match]]
+    ) -> List[DetectedPattern]:
         """Detect all sensitive patterns in text."""
         detected = []
         
         # Check regex patterns
         for pattern_type, pattern_info in self.PATTERNS.items():
-            matches = re.finditer(pattern_info['regex'], text, re.IGNORECASE)
-            match_list = list(matches)
+            match_list = matches[pattern_type]
             
             if match_list:
                 # Mask examples for privacy
@@ -209,13 +247,16 @@ class ExplainabilityService:
         
         # Check keyword categories
         text_lower = text.lower()
+        word_count = None
         for category, category_info in self.KEYWORDS.items():
-            found_words = [word for word in category_info['words'] 
-                          if word.lower() in text_lower]
+            found_words = [word for word in self._KEYWORD_WORDS[category]
+                          if word in text_lower]
             
             if found_words:
                 # Calculate confidence based on keyword density
-                word_count = len(text.split())
+                # (the text is split into words once, on the first hit)
+                if word_count is None:
+                    word_count = len(text.split())
                 density = len(found_words) / max(word_count, 1)
                 confidence = min(0.5 + density * 10, 0.95)  # 0.5 to 0.95
                 
@@ -305,25 +346,22 @@ class ExplainabilityService:
     
     def _find_sensitive_regions(
         self,
-        text: str,
-        detected_patterns: List[DetectedPattern]
+        matches: Dict[str, List[re.Match]]
     ) -> List[SensitiveRegion]:
         """Find and mark sensitive regions in text."""
         regions = []
         
-        # Find regex pattern matches
-        for pattern in detected_patterns:
-            if not pattern.type.endswith('_keywords'):
-                pattern_info = self.PATTERNS.get(pattern.type)
-                if pattern_info:
-                    for match in re.finditer(pattern_info['regex'], text, re.IGNORECASE):
-                        regions.append(SensitiveRegion(
-                            start=match.start(),
-                            end=match.end(),
-                            type=pattern.type,
-                            severity=pattern_info['severity'],
-                            text=self._mask_sensitive(match.group(), pattern.type)
-                        ))
+        # Mark regex pattern matches
+        for pattern_type, match_list in matches.items():
+            severity = self.PATTERNS[pattern_type]['severity']
+            for match in match_list:
+                regions.append(SensitiveRegion(
+                    start=match.start(),
+                    end=match.end(),
+                    type=pattern_type,
+                    severity=severity,
+                    text=self._mask_sensitive(match.group(), pattern_type)
+                ))
         
         # Sort by position
         regions.sort(key=lambda r: r.start)
@@ -353,3 +391,14 @@ class ExplainabilityService:
         # Medium severity
         pattern_names = [self._get_pattern_name(p.type) for p in detected_patterns[:2]]
         return f"Document contains {', '.join(pattern_names)}, classified as {sensitivity_level.value}."
+
+
+@lru_cache(maxsize=1)
+def get_explainer() -> ExplainabilityService:
+    """
+    Get the shared explainability service.
+    
+    Returns:
+        ExplainabilityService: Shared instance (built once, reused by every request)
+    """
+    return ExplainabilityService()
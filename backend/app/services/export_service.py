@@ -5,17 +5,68 @@ Handles exporting data to various formats including CSV and PDF.
 Supports audit log exports and compliance reports.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 import csv
 import io
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.audit_log import AuditLog
+from app.models.audit_log import AuditLog, HIGH_RISK_SCORE
 from app.models.data_classification import DataItem
 from app.utils.logger import logger
 
 
+# Data item export columns
+_DATA_EXPORT_COLUMNS = (
+    DataItem.id,
+    DataItem.user_id,
+    DataItem.sensitivity_level,
+    DataItem.confidence_score,
+    DataItem.encrypted_content,
+    DataItem.encryption_algorithm,
+    DataItem.hash_algorithm,
+    DataItem.hash_value,
+    DataItem.signature.isnot(None).label("has_signature"),
+    DataItem.created_at,
+)
+
+# Audit log CSV export: header row and the columns it is built from
+_AUDIT_CSV_HEADER = (
+    'ID',
+    'Timestamp',
+    'User ID',
+    'Action',
+    'Data ID',
+    'Risk Score',
+    'MFA Required',
+    'MFA Completed',
+    'IP Address',
+    'Request Path',
+    'Request Method',
+    'Status Code',
+    'Success',
+    'Failure Reason'
+)
+
+_AUDIT_CSV_COLUMNS = (
+    AuditLog.id,
+    AuditLog.timestamp,
+    AuditLog.user_id,
+    AuditLog.action,
+    AuditLog.data_id,
+    AuditLog.risk_score,
+    AuditLog.mfa_required,
+    AuditLog.mfa_completed,
+    AuditLog.ip_address,
+    AuditLog.request_path,
+    AuditLog.request_method,
+    AuditLog.status_code,
+    AuditLog.success,
+    AuditLog.failure_reason,
+)
+
+
 class ExportService:
     """Service for exporting data to various formats."""
     
@@ -23,82 +74,79 @@ class ExportService:
         """Initialize export service with database session."""
         self.db = db
     
-    def export_audit_logs_csv(
+    def iter_audit_logs_csv(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        user_id: Optional[int] = None
-    ) -> str:
+        user_id: Optional[int] = None,
+        chunk_rows: int = 1000
+    ) -> Iterator[str]:
         """
-        Export audit logs to CSV format.
+        Export audit logs to CSV format, in chunks.
+        
+        Rows are fetched and written chunk_rows at a time, so memory use
+        does not grow with the size of the export.
         
         Args:
             start_date: Optional start date filter
             end_date: Optional end date filter
             user_id: Optional user ID filter
+            chunk_rows: Rows per yielded chunk
             
-        Returns:
-            CSV string content
+        Yields:
+            CSV text: the header, then chunks of up to chunk_rows rows
         """
         # Build query
-        query = self.db.query(AuditLog)
+        query = select(*_AUDIT_CSV_COLUMNS)
         
         if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
+            query = query.where(AuditLog.timestamp >= start_date)
         if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
+            query = query.where(AuditLog.timestamp <= end_date)
         if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
+            query = query.where(AuditLog.user_id == user_id)
         
-        # Order by timestamp descending
-        logs = query.order_by(AuditLog.timestamp.desc()).all()
+        # Order by timestamp descending, fetched in batches as rows are written
+        result = self.db.execute(
+            query.order_by(AuditLog.timestamp.desc()).execution_options(yield_per=chunk_rows)
+        )
         
-        # Create CSV in memory
+        # One buffer, emptied after each chunk
         output = io.StringIO()
         writer = csv.writer(output)
         
-        # Write header
-        writer.writerow([
-            'ID',
-            'Timestamp',
-            'User ID',
-            'Action',
-            'Data ID',
-            'Risk Score',
-            'MFA Required',
-            'MFA Completed',
-            'IP Address',
-            'Request Path',
-            'Request Method',
-            'Status Code',
-            'Success',
-            'Failure Reason'
-        ])
-        
-        # Write data rows
-        for log in logs:
-            writer.writerow([
-                log.id,
-                log.timestamp.isoformat() if log.timestamp else '',
-                log.user_id or '',
-                log.action or '',
-                log.data_id or '',
-                log.risk_score or '',
-                log.mfa_required,
-                log.mfa_completed,
-                log.ip_address or '',
-                log.request_path or '',
-                log.request_method or '',
-                log.status_code or '',
-                log.success,
-                log.failure_reason or ''
-            ])
-        
-        csv_content = output.getvalue()
+        writer.writerow(_AUDIT_CSV_HEADER)
+        yield output.getvalue()
+        
+        count = 0
+        for rows in result.partitions():
+            output.seek(0)
+            output.truncate()
+            writer.writerows(
+                (
+                    log.id,
+                    log.timestamp.isoformat() if log.timestamp else '',
+                    log.user_id or '',
+                    log.action or '',
+                    log.data_id or '',
+                    log.risk_score or '',
+                    log.mfa_required,
+                    log.mfa_completed,
+                    log.ip_address or '',
+                    log.request_path or '',
+                    log.request_method or '',
+                    log.status_code or '',
+                    log.success,
+                    log.failure_reason or ''
+                )
+                for log in rows
+            )
+            count += len(rows)
+            yield output.getvalue()
+        
         output.close()
         
-        logger.info(f"Exported {len(logs)} audit logs to CSV")
-        return csv_content
+        logger.info(f"Exported {count} audit logs to CSV")
     
     def generate_compliance_report(
         self,
@@ -138,7 +186,7 @@ class ExportService:
             action_counts[log.action] = action_counts.get(log.action, 0) + 1
         
         # Count high-risk actions
-        high_risk_actions = sum(1 for log in logs if log.risk_score and log.risk_score >= 61)
+        high_risk_actions = sum(1 for log in logs if log.risk_score and log.risk_score >= HIGH_RISK_SCORE)
         
         # Count MFA enforcements
         mfa_required_count = sum(1 for log in logs if log.mfa_required)
@@ -184,7 +232,10 @@ class ExportService:
         Returns:
             Dictionary containing data item information
         """
-        data_item = self.db.query(DataItem).filter(DataItem.id == data_id).first()
+        # One statement reading only the exported columns (never the plaintext)
+        data_item = self.db.execute(
+            select(*_DATA_EXPORT_COLUMNS).where(DataItem.id == data_id)
+        ).first()
         
         if not data_item:
             return None
@@ -192,15 +243,14 @@ class ExportService:
         export_data = {
             'id': data_item.id,
             'sensitivity_level': data_item.sensitivity_level,
-            'classification_confidence': data_item.classification_confidence,
-            'encrypted_data': data_item.encrypted_data,
+            'classification_confidence': data_item.confidence_score,
+            'encrypted_data': data_item.encrypted_content,
             'encryption_algorithm': data_item.encryption_algorithm,
-            'key_size': data_item.key_size,
             'hash_algorithm': data_item.hash_algorithm,
             'hash_value': data_item.hash_value,
-            'has_signature': data_item.signature is not None,
+            'has_signature': data_item.has_signature,
             'created_at': data_item.created_at.isoformat() if data_item.created_at else None,
-            'created_by': data_item.created_by
+            'created_by': data_item.user_id
         }
         
         logger.info(f"Exported data item {data_id}")
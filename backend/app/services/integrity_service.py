@@ -10,6 +10,8 @@ from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 from math import ceil, log2
 
+from app.core.crypto import sha256_hash_many
+
 
 @dataclass
 class MerkleProof:
@@ -76,7 +78,7 @@ class MerkleTree:
             return []
         
         # Level 0: Hash all chunks (leaf nodes)
-        current_level = [self._hash(chunk) for chunk in self.chunks]
+        current_level = sha256_hash_many(self.chunks)
         tree_levels = [current_level.copy()]
         
         # Build tree upward until we have a single root
@@ -12,9 +12,17 @@ import pyotp
 import qrcode
 import io
 import base64
+import hashlib
 import secrets
+from functools import lru_cache
 from typing import Tuple, List
 
+from app.config import settings
+
+
+# Backup codes are only 32 bits, so they are hashed with a server-side key
+_BACKUP_CODE_KEY = hashlib.sha256(settings.SECRET_KEY.encode('utf-8')).digest()
+
 
 class MFAService:
     """Service for managing TOTP-based MFA."""
@@ -46,10 +54,14 @@ class MFAService:
         return totp.provisioning_uri(name=username, issuer_name=issuer)
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def generate_qr_code(secret: str, username: str) -> str:
         """
         Generate a QR code image for TOTP setup.
         
+        Rendering takes several milliseconds, so images are cached per
+        (secret, username) for repeated enrollment requests.
+        
         Args:
             secret: TOTP secret key
             username: User's username
@@ -115,22 +127,46 @@ class MFAService:
             codes.append(code)
         return codes
     
+    @staticmethod
+    def hash_backup_code(code: str) -> str:
+        """
+        Hash a backup code for storage.
+        
+        Args:
+            code: Backup code (dashes, spaces and case are ignored)
+            
+        Returns:
+            str: Hex-encoded keyed BLAKE2b digest
+        """
+        normalized = code.upper().replace("-", "").replace(" ", "")
+        return hashlib.blake2b(
+            normalized.encode('utf-8'),
+            key=_BACKUP_CODE_KEY,
+            digest_size=16,
+        ).hexdigest()
+    
     @staticmethod
     def verify_backup_code(backup_codes: List[str], code: str) -> Tuple[bool, List[str]]:
         """
         Verify a backup code and remove it from the list.
         
         Args:
-            backup_codes: List of remaining backup codes
+            backup_codes: List of remaining hashed backup codes
             code: Code to verify
             
         Returns:
             tuple: (is_valid, updated_backup_codes)
         """
-        code_upper = code.upper().replace("-", "").replace(" ", "")
+        code_hash = MFAService.hash_backup_code(code)
         
-        if code_upper in backup_codes:
+        if code_hash in backup_codes:
             # Remove used code
+            updated_codes = [c for c in backup_codes if c != code_hash]
+            return True, updated_codes
+        
+        # Codes stored before hashing was introduced are plain text
+        code_upper = code.upper().replace("-", "").replace(" ", "")
+        if code_upper in backup_codes:
             updated_codes = [c for c in backup_codes if c != code_upper]
             return True, updated_codes
         
@@ -5,6 +5,7 @@ Handles data classification using rule-based classification.
 (ML model will be fine-tuned later with DistilBERT)
 """
 
+from functools import lru_cache
 from typing import Tuple, Optional
 import re
 
@@ -59,6 +60,12 @@ class MLClassifierService:
         ],
     }
     
+    # Keyword patterns compiled once per level
+    _COMPILED_KEYWORDS = {
+        level: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+        for level, patterns in KEYWORDS.items()
+    }
+    
     def __init__(self, use_ml: bool = False):
         """
         Initialize ML classifier service.
@@ -100,16 +107,17 @@ class MLClassifierService:
         Returns:
             tuple: (sensitivity_level, confidence_score)
         """
+        # Blank text cannot match any keyword - assume public
+        if not text or text.isspace():
+            return SensitivityLevel.PUBLIC, 0.7
+        
         text_lower = text.lower()
         
         # Count matches for each sensitivity level
-        matches = {}
-        for level, keywords in self.KEYWORDS.items():
-            count = 0
-            for pattern in keywords:
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    count += 1
-            matches[level] = count
+        matches = {
+            level: sum(1 for pattern in patterns if pattern.search(text_lower))
+            for level, patterns in self._COMPILED_KEYWORDS.items()
+        }
         
         # Determine sensitivity level (highest match count wins)
         max_matches = max(matches.values())
@@ -128,8 +136,8 @@ class MLClassifierService:
                 confidence = min(0.7 + (max_matches * 0.05), 0.95)
                 
                 logger.info(
-                    f"Classified text as {level.value} "
-                    f"(matches: {max_matches}, confidence: {confidence:.2f})"
+                    "Classified text as %s (matches: %d, confidence: %.2f)",
+                    level.value, max_matches, confidence
                 )
                 
                 return level, confidence
@@ -166,3 +174,20 @@ class MLClassifierService:
             "keyword_count": len(matched_keywords),
             "method": "rule-based",
         }
+
+
+@lru_cache(maxsize=2)
+def get_classifier(use_ml: bool = False) -> MLClassifierService:
+    """
+    Get the shared classifier for a classification mode.
+    
+    The service holds no per-request state, so one instance per mode is
+    built (on first use or at startup) and reused by every request.
+    
+    Args:
+        use_ml: Whether to use the ML model
+        
+    Returns:
+        MLClassifierService: Shared classifier instance
+    """
+    return MLClassifierService(use_ml=use_ml)
@@ -6,6 +6,7 @@ sensitivity levels and risk scores.
 """
 
 from typing import Optional, Dict, Any
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.encryption_policy import EncryptionPolicy, MFARequirement
@@ -128,22 +129,30 @@ class PolicyEngineService:
         
         Args:
             sensitivity_level: Target sensitivity level
-            updates: Dictionary of fields to update
+            updates: Column values to update (only the given columns are written)
             
         Returns:
             EncryptionPolicy: Updated policy, or None if not found
         """
-        policy = self.get_policy(sensitivity_level)
+        if not updates:
+            return self.get_policy(sensitivity_level)
+        
+        # Single UPDATE of the given columns; RETURNING gives back the row
+        policy = self.db.execute(
+            update(EncryptionPolicy)
+            .where(EncryptionPolicy.sensitivity_level == sensitivity_level.lower())
+            .values(**updates)
+            .returning(EncryptionPolicy)
+        ).scalar_one_or_none()
         
         if not policy:
+            logger.warning(f"No policy found for sensitivity level: {sensitivity_level}")
             return None
         
-        for key, value in updates.items():
-            if hasattr(policy, key):
-                setattr(policy, key, value)
-        
+        # Detach the returned row so the commit does not expire it; the
+        # caller serializes the values RETURNING loaded, with no re-SELECT
+        self.db.expunge(policy)
         self.db.commit()
-        self.db.refresh(policy)
         
         logger.info(f"Updated policy for {sensitivity_level}: {updates}")
         return policy
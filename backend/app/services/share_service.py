@@ -9,18 +9,18 @@ from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import secrets
-import base64
+import pybase64
 import hashlib
 
 from app.models.share_link import ShareLink
 from app.core.crypto import (
-    aes_encrypt,
+    aes_encrypt_bytes,
     aes_decrypt,
     generate_aes_key,
-    sha256_hash,
     verify_hash,
 )
 from app.schemas.share import SensitivityLevel
+from app.services.integrity_service import IntegrityService
 from app.utils.logger import logger
 
 
@@ -61,12 +61,12 @@ class ShareService:
             600000  # OWASP recommended iterations
         )
         # Store salt + hash
-        return base64.b64encode(salt + key).decode('utf-8')
+        return pybase64.b64encode_as_string(salt + key)
     
     def _verify_password(self, password: str, password_hash: str) -> bool:
         """Verify password against stored hash."""
         try:
-            decoded = base64.b64decode(password_hash.encode('utf-8'))
+            decoded = pybase64.b64decode(password_hash)
             salt = decoded[:32]
             stored_key = decoded[32:]
             
@@ -115,17 +115,17 @@ class ShareService:
         # Generate encryption key
         encryption_key = generate_aes_key(256)
         
-        # Convert bytes to string for encryption
-        content_str = content.decode('latin-1')  # Use latin-1 to preserve bytes
+        # Shares store the UTF-8 form of the latin-1 text of the file
+        # (a lossless mapping of any bytes); converted once, used by both steps
+        plaintext = content.decode('latin-1').encode('utf-8')
         
         # Encrypt content
-        result = aes_encrypt(plaintext=content_str, key=encryption_key)
+        nonce, ciphertext, tag = aes_encrypt_bytes(plaintext, encryption_key)
        
         # Hash plaintext for integrity verification
-        hash_value = sha256_hash(content_str)
+        hash_value = hashlib.sha256(plaintext).hexdigest()
         
         # Generate Merkle tree for advanced integrity (Phase 2)
-        from app.services.integrity_service import IntegrityService
         merkle_tree = IntegrityService.create_merkle_tree(content)
         merkle_root = merkle_tree.get_root()
         tree_chunk_size = merkle_tree.chunk_size
@@ -148,11 +148,11 @@ class ShareService:
         # Create share link record
         share_link = ShareLink(
             share_token=share_token,
-            encrypted_content=result['ciphertext'],
+            encrypted_content=pybase64.b64encode_as_string(ciphertext),
             encryption_algorithm="AES-256-GCM",
-            nonce=result['nonce'],
-            tag=result['tag'],
-            encryption_key=base64.b64encode(encryption_key).decode('utf-8'),
+            nonce=pybase64.b64encode_as_string(nonce),
+            tag=pybase64.b64encode_as_string(tag),
+            encryption_key=pybase64.b64encode_as_string(encryption_key),
             hash_value=hash_value,
             hash_algorithm="SHA-256",
             password_hash=password_hash_value,
@@ -227,7 +227,7 @@ class ShareService:
         logger.info(f"Decrypting share link: {share_link.share_token}")
         
         # Get encrypted data (already base64)
-        key = base64.b64decode(share_link.encryption_key)
+        key = pybase64.b64decode(share_link.encryption_key)
         
         # Decrypt
         try:
@@ -343,8 +343,6 @@ class ShareService:
             logger.warning(f"No Merkle root for {share_link.share_token}")
             return False
         
-        from app.services.integrity_service import IntegrityService
-        
         is_valid = IntegrityService.verify_integrity(
             content=content,
             expected_root=share_link.merkle_root,
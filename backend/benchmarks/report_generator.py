@@ -8,8 +8,8 @@ Author: AI-Driven Adaptive Cryptographic Policy Engine
 Created: 2025-12-13
 """
 
-import json
 import csv
+import orjson
 from typing import List, Dict
 from io import StringIO
 from dataclasses import asdict
@@ -20,7 +20,7 @@ from benchmarks.benchmark_suite import BenchmarkReport, BenchmarkResult
 # JSON EXPORT
 # ============================================================================
 
-def generate_json_report(report: BenchmarkReport) -> str:
+def generate_json_report(report: BenchmarkReport) -> bytes:
     """
     Generate JSON formatted benchmark report.
     
@@ -28,22 +28,25 @@ def generate_json_report(report: BenchmarkReport) -> str:
         report: BenchmarkReport to convert to JSON
         
     Returns:
-        JSON string representation of the report
+        UTF-8 encoded JSON representation of the report
         
     Example:
         json_data = generate_json_report(report)
-        with open('benchmark_results.json', 'w') as f:
+        with open('benchmark_results.json', 'wb') as f:
             f.write(json_data)
     """
-    # Convert dataclass to dictionary
+    # orjson serializes the result dataclasses natively (no asdict copy)
     report_dict = {
         'timestamp': report.timestamp,
         'summary': report.summary,
-        'results': [asdict(result) for result in report.results]
+        'results': report.results
     }
     
     # Pretty print JSON with indentation
-    return json.dumps(report_dict, indent=2)
+    return orjson.dumps(
+        report_dict,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    )
 
 
 # ============================================================================
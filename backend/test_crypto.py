@@ -4,7 +4,10 @@ Test encryption/decryption directly
 import sys
 sys.path.insert(0, '.')
 
-from app.core.crypto import aes_encrypt, aes_decrypt
+from app.core.crypto import aes_encrypt, aes_decrypt, aes_encrypt_bytes, aes_decrypt_bytes, generate_aes_key
+from app.core.crypto import generate_rsa_keypair, hybrid_encrypt, hybrid_decrypt
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
 import base64
 
 # Test AES encryption/decryption
@@ -31,3 +34,51 @@ decrypted = aes_decrypt(
 
 print(f"Decrypted: {decrypted}")
 print(f"Match: {decrypted == plaintext}")
+
+# Test raw bytes round trip
+print("\nTesting AES bytes encryption/decryption...")
+data = b"\x00\xffraw bytes\x80"
+key_bytes = generate_aes_key(256)
+nonce, ciphertext, tag = aes_encrypt_bytes(data, key_bytes)
+print(f"Types: {type(nonce).__name__}, {type(ciphertext).__name__}, {type(tag).__name__}")
+
+decrypted_bytes = aes_decrypt_bytes(ciphertext, key_bytes, nonce, tag)
+print(f"Match: {decrypted_bytes == data}")
+assert decrypted_bytes == data, "AES bytes round trip failed!"
+
+# Test hybrid (AES + RSA) round trip
+print("\nTesting hybrid encryption/decryption...")
+private_key, public_key = generate_rsa_keypair(2048)
+result = hybrid_encrypt(plaintext, public_key)
+decrypted = hybrid_decrypt(
+    result["encrypted_data"],
+    result["encrypted_key"],
+    result["nonce"],
+    result["tag"],
+    private_key
+)
+print(f"Match: {decrypted == plaintext}")
+assert decrypted == plaintext, "Hybrid round trip failed!"
+
+# Records from before the raw key wrap have the base64 text of the AES key
+# (44 bytes) wrapped with RSA; they must still decrypt
+print("\nTesting hybrid decryption of a legacy base64-wrapped key...")
+key_bytes = generate_aes_key(256)
+legacy = aes_encrypt(plaintext, key_bytes)
+legacy_wrapped_key = public_key.encrypt(
+    base64.b64encode(key_bytes),
+    padding.OAEP(
+        mgf=padding.MGF1(algorithm=hashes.SHA256()),
+        algorithm=hashes.SHA256(),
+        label=None
+    )
+)
+decrypted = hybrid_decrypt(
+    legacy["ciphertext"],
+    base64.b64encode(legacy_wrapped_key).decode(),
+    legacy["nonce"],
+    legacy["tag"],
+    private_key
+)
+print(f"Match: {decrypted == plaintext}")
+assert decrypted == plaintext, "Legacy hybrid decryption failed!"
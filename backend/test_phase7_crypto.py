@@ -6,6 +6,8 @@ Verify that all newly implemented algorithms work correctly:
 - ECC key generation (P-256, P-384, P-521)
 - ECDSA signatures  
 - SHA-3 hashing (256, 512)
+- ECIES hybrid encryption (ECDH + AES-GCM)
+- Ed25519 signatures
 """
 
 import sys
@@ -19,6 +21,13 @@ from app.core.crypto import (
     generate_ecc_keypair,
     ecc_sign_data,
     ecc_verify_signature,
+    # ECIES
+    hybrid_encrypt_ecc,
+    hybrid_decrypt_ecc,
+    # Ed25519
+    generate_ed25519_keypair,
+    sign_data_ed25519,
+    verify_signature_ed25519,
     # SHA-3
     sha3_256_hash,
     sha3_512_hash,
@@ -94,6 +103,71 @@ def test_ecc_p384():
     print("✅ ECC P-384 works correctly!")
 
 
+def test_ecies():
+    """Test ECIES hybrid encryption/decryption."""
+    print("\n=== Testing ECIES (ECDH + AES-256-GCM) ===")
+    
+    private_key, public_key = generate_ecc_keypair("P-256")
+    plaintext = "Secret message for ECIES testing!"
+    
+    # Round trip
+    result = hybrid_encrypt_ecc(plaintext, public_key)
+    print(f"Algorithm: {result['algorithm']}")
+    fields = {k: result[k] for k in ("encrypted_data", "ephemeral_key", "nonce", "tag")}
+    decrypted = hybrid_decrypt_ecc(**fields, private_key=private_key)
+    print(f"Decrypted: {decrypted}")
+    assert decrypted == plaintext, "ECIES decryption failed!"
+    
+    # Tampered ciphertext fails authentication
+    import base64
+    ciphertext = bytearray(base64.b64decode(fields["encrypted_data"]))
+    ciphertext[0] ^= 1
+    tampered = dict(fields, encrypted_data=base64.b64encode(bytes(ciphertext)).decode())
+    try:
+        hybrid_decrypt_ecc(**tampered, private_key=private_key)
+        assert False, "Tampered ECIES ciphertext decrypted!"
+    except ValueError:
+        print("✅ Tampered ciphertext rejected")
+    
+    # Another recipient's key derives a different AES key
+    other_private_key, _ = generate_ecc_keypair("P-256")
+    try:
+        hybrid_decrypt_ecc(**fields, private_key=other_private_key)
+        assert False, "ECIES decrypted with the wrong key!"
+    except ValueError:
+        print("✅ Wrong private key rejected")
+    
+    print("✅ ECIES works correctly!")
+
+
+def test_ed25519():
+    """Test Ed25519 signatures."""
+    print("\n=== Testing Ed25519 ===")
+    
+    private_key, public_key = generate_ed25519_keypair()
+    print("✅ Generated Ed25519 keypair")
+    
+    data = "Important document to sign"
+    signature = sign_data_ed25519(data, private_key)
+    print(f"Signature: {signature[:50]}...")
+    
+    # Valid, tampered data, wrong key and malformed signature
+    _, other_public_key = generate_ed25519_keypair()
+    is_valid = verify_signature_ed25519(data, signature, public_key)
+    tampered_valid = verify_signature_ed25519("Tampered data", signature, public_key)
+    wrong_key_valid = verify_signature_ed25519(data, signature, other_public_key)
+    malformed_valid = verify_signature_ed25519(data, signature[:20], public_key)
+    print(f"Signature valid: {is_valid}")
+    print(f"Tampered signature valid: {tampered_valid}")
+    print(f"Wrong key signature valid: {wrong_key_valid}")
+    
+    assert is_valid == True, "Valid signature failed!"
+    assert tampered_valid == False, "Tampered signature passed!"
+    assert wrong_key_valid == False, "Signature passed with the wrong key!"
+    assert malformed_valid == False, "Malformed signature passed!"
+    print("✅ Ed25519 signatures work correctly!")
+
+
 def test_sha3():
     """Test SHA-3 hashing."""
     print("\n=== Testing SHA-3 ===")
@@ -126,6 +200,8 @@ def main():
         test_chacha20()
         test_ecc_p256()
         test_ecc_p384()
+        test_ecies()
+        test_ed25519()
         test_sha3()
         
         print("\n" + "=" * 60)
@@ -135,6 +211,8 @@ def main():
         print("  ✅ ChaCha20-Poly1305 (symmetric encryption)")
         print("  ✅ ECC P-256 (asymmetric, signatures)")
         print("  ✅ ECC P-384 (high security)")
+        print("  ✅ ECIES (ECDH hybrid encryption)")
+        print("  ✅ Ed25519 (signatures)")
         print("  ✅ SHA3-256 (hashing)")
         print("  ✅ SHA3-512 (hashing)")
         print("\nYour specification is now 100% complete!")